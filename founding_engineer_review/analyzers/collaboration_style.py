@@ -6,11 +6,15 @@ Analyzes review comments, feedback receptiveness, and work rhythm patterns.
 """
 
 import re
-from datetime import datetime, timezone
+from datetime import timezone
 from typing import Dict, List, Tuple
 from collections import defaultdict, Counter
 
-from ..models.metrics import CollaborationStyleMetrics, ActivityData, WorkRhythmPattern
+from ..models.metrics import (
+    CollaborationStyleMetrics, ActivityData, WorkRhythmPattern, PullRequestRecord,
+    CommentRecord, IssueRecord, ReviewRecord
+)
+from ..timestamps import as_datetime
 
 
 class CollaborationStyleAnalyzer:
@@ -21,7 +25,11 @@ class CollaborationStyleAnalyzer:
         self._init_patterns()
     
     def _init_patterns(self):
-        """Initialize patterns for communication analysis."""
+        """Initialize patterns for communication analysis.
+        
+        Patterns are lowercase and always matched against lowercased text,
+        so no case-insensitive flag is needed.
+        """
         
         # Comment type classification patterns
         self.comment_patterns = {
@@ -70,7 +78,15 @@ class CollaborationStyleAnalyzer:
             r'recommend', r'experience', r'learned'
         ]
     
-    def classify_review_comments(self, reviews: List[Dict], comments: List[Dict]) -> Dict[str, int]:
+    def _classify_comment(self, body: str) -> str:
+        """Return the first comment type whose patterns match body, else 'informational'."""
+        return next(
+            (comment_type for comment_type, patterns in self.comment_patterns.items()
+             if any(re.search(pattern, body) for pattern in patterns)),
+            'informational'
+        )
+    
+    def classify_review_comments(self, reviews: List[ReviewRecord], comments: List[CommentRecord]) -> Dict[str, int]:
         """
         Classify code review comments by type.
         
@@ -85,42 +101,24 @@ class CollaborationStyleAnalyzer:
         
         # Analyze review comments
         for review in reviews:
-            body = review.get('body', '').lower()
+            body = review.body.lower()
             if not body:
                 continue
             
-            # Classify this comment
-            classified = False
-            for comment_type, patterns in self.comment_patterns.items():
-                if any(re.search(pattern, body, re.IGNORECASE) for pattern in patterns):
-                    comment_distribution[comment_type] += 1
-                    classified = True
-                    break
-            
-            # If not classified, it's informational
-            if not classified:
-                comment_distribution['informational'] += 1
+            # Classify this comment (unmatched comments are informational)
+            comment_distribution[self._classify_comment(body)] += 1
         
         # Analyze general comments (issue/PR comments)
         for comment in comments:
-            body = comment.get('comment_body', '').lower()
+            body = comment.comment_body.lower()
             if not body:
                 continue
             
-            # Classify this comment
-            classified = False
-            for comment_type, patterns in self.comment_patterns.items():
-                if any(re.search(pattern, body, re.IGNORECASE) for pattern in patterns):
-                    comment_distribution[comment_type] += 1
-                    classified = True
-                    break
-            
-            if not classified:
-                comment_distribution['informational'] += 1
+            comment_distribution[self._classify_comment(body)] += 1
         
         return dict(comment_distribution)
     
-    def analyze_feedback_receptiveness(self, pull_requests: List[Dict], comments: List[Dict]) -> float:
+    def analyze_feedback_receptiveness(self, pull_requests: List[PullRequestRecord], comments: List[CommentRecord]) -> float:
         """
         Analyze receptiveness to feedback in PR discussions.
         
@@ -138,7 +136,7 @@ class CollaborationStyleAnalyzer:
         
         user_responses = []
         for comment in comments:
-            body = comment.get('comment_body', '').lower()
+            body = comment.comment_body.lower()
             if body:
                 user_responses.append(body)
         
@@ -151,14 +149,14 @@ class CollaborationStyleAnalyzer:
             
             # Positive receptiveness indicators
             positive_count = sum(1 for pattern in self.receptiveness_patterns['positive'] 
-                               if re.search(pattern, response, re.IGNORECASE))
+                               if re.search(pattern, response))
             
             collaborative_count = sum(1 for pattern in self.receptiveness_patterns['collaborative'] 
-                                    if re.search(pattern, response, re.IGNORECASE))
+                                    if re.search(pattern, response))
             
             # Negative receptiveness indicators
             defensive_count = sum(1 for pattern in self.receptiveness_patterns['defensive'] 
-                                if re.search(pattern, response, re.IGNORECASE))
+                                if re.search(pattern, response))
             
             # Calculate score for this response
             if positive_count > 0 or collaborative_count > 0:
@@ -188,17 +186,13 @@ class CollaborationStyleAnalyzer:
         timestamps = []
         
         for activity in activity_data.timeline:
-            timestamp_str = activity.get('timestamp', '')
-            if timestamp_str:
-                try:
-                    # Parse ISO format timestamp
-                    if timestamp_str.endswith('Z'):
-                        timestamp_str = timestamp_str[:-1] + '+00:00'
-                    
-                    dt = datetime.fromisoformat(timestamp_str)
-                    timestamps.append(dt)
-                except:
-                    continue
+            try:
+                dt = as_datetime(activity.timestamp) if activity.timestamp else None
+            except:
+                continue
+            
+            if dt:
+                timestamps.append(dt)
         
         if not timestamps:
             return WorkRhythmPattern.UNKNOWN, 0.0
@@ -264,7 +258,7 @@ class CollaborationStyleAnalyzer:
         
         return pattern, dedication_score
     
-    def analyze_mentorship_indicators(self, reviews: List[Dict], comments: List[Dict]) -> List[str]:
+    def analyze_mentorship_indicators(self, reviews: List[ReviewRecord], comments: List[CommentRecord]) -> List[str]:
         """
         Analyze indicators of mentorship and knowledge sharing.
         
@@ -280,16 +274,16 @@ class CollaborationStyleAnalyzer:
         
         # Check review comments for mentorship
         for review in reviews:
-            body = review.get('body', '').lower()
+            body = review.body.lower()
             
-            if any(re.search(pattern, body, re.IGNORECASE) for pattern in self.mentorship_patterns):
+            if any(re.search(pattern, body) for pattern in self.mentorship_patterns):
                 mentorship_count += 1
         
         # Check general comments for mentorship
         for comment in comments:
-            body = comment.get('comment_body', '').lower()
+            body = comment.comment_body.lower()
             
-            if any(re.search(pattern, body, re.IGNORECASE) for pattern in self.mentorship_patterns):
+            if any(re.search(pattern, body) for pattern in self.mentorship_patterns):
                 mentorship_count += 1
         
         total_comments = len(reviews) + len(comments)
@@ -304,7 +298,7 @@ class CollaborationStyleAnalyzer:
         
         return mentorship_indicators
     
-    def analyze_communication_clarity(self, pull_requests: List[Dict], issues: List[Dict]) -> float:
+    def analyze_communication_clarity(self, pull_requests: List[PullRequestRecord], issues: List[IssueRecord]) -> float:
         """
         Analyze clarity and quality of written communication.
         
@@ -319,8 +313,8 @@ class CollaborationStyleAnalyzer:
         
         # Analyze PR descriptions
         for pr in pull_requests:
-            title = pr.get('title', '')
-            body = pr.get('body', '')
+            title = pr.title
+            body = pr.body
             
             score = 0.0
             
@@ -345,8 +339,8 @@ class CollaborationStyleAnalyzer:
         
         # Analyze issue descriptions
         for issue in issues:
-            title = issue.get('title', '')
-            body = issue.get('body', '')
+            title = issue.title
+            body = issue.body
             
             score = 0.0
             
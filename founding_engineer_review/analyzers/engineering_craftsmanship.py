@@ -6,71 +6,167 @@ Analyzes workflow discipline, PR quality, testing habits, and structured develop
 """
 
 import re
-from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, field
+from datetime import timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from collections import defaultdict
 
-from ..models.metrics import EngineeringCraftsmanshipMetrics, ActivityData
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+from ..models.metrics import (
+    EngineeringCraftsmanshipMetrics, ActivityData, CommitRecord, PullRequestRecord, ReviewRecord
+)
+from ..timestamps import as_datetime
+from .patches import lowered_patch
+
+
+def _fuse(patterns):
+    """Compile a list of regex sources into a single alternation."""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns))
+
+
+# Commit-issue linking patterns (matched against lowercased messages)
+_ISSUE_LINK_RE = _fuse([
+    r'closes?\s+#(\d+)',
+    r'fixes?\s+#(\d+)',
+    r'resolves?\s+#(\d+)',
+    r'addresses?\s+#(\d+)',
+    r'implements?\s+#(\d+)',
+    r'refs?\s+#(\d+)',
+    r'see\s+#(\d+)',
+    r'related\s+to\s+#(\d+)'
+])
+
+
+def _is_test_file(path: str) -> bool:
+    """
+    Check whether a lowercased repository path is a test file.
+    
+    Equivalent to anchoring these patterns at the start of the path:
+    test_*.py, *_test.py, test(s)/*.py, spec/*.py, *.test.js|ts,
+    *.spec.js|ts and __tests__/*.js|ts.
+    """
+    if path.endswith('.py'):
+        return path.startswith(('test_', 'test/', 'tests/', 'spec/')) or path.endswith('_test.py')
+    return (path.endswith(('.test.js', '.test.ts', '.spec.js', '.spec.ts')) or
+            (path.startswith('__tests__/') and path.endswith(('.js', '.ts'))))
+
+
+def _is_doc_file(path: str) -> bool:
+    """
+    Check whether a lowercased repository path is a documentation file.
+    
+    Equivalent to anchoring these patterns at the start of the path:
+    readme*.md, doc(s)/*.md, *.rst, changelog*, contributing* and license*.
+    """
+    if path.startswith(('changelog', 'contributing', 'license')) or path.endswith('.rst'):
+        return True
+    return path.endswith('.md') and path.startswith(('readme', 'doc/', 'docs/'))
+
+
+# Code quality indicators, one alternation per category (matched against lowercased patches)
+_QUALITY_RES = {
+    'type_hints': _fuse([r':\s*\w+\s*=', r'->\s*\w+:', r'typing\.', r'from typing']),
+    'docstrings': _fuse([r'""".*?"""', r"'''.*?'''"]),
+    'error_handling': _fuse([r'try:', r'except', r'raise', r'finally:']),
+    'validation': _fuse([r'assert\s+', r'validate', r'check', r'verify']),
+    'logging': _fuse([r'log\.|logger\.', r'logging\.'])
+}
+
+# Joins patches into one corpus for _QUALITY_RES. '.' cannot cross the newline
+# and '\s'/'\w' cannot match the NULs, so no indicator matches across patches.
+_PATCH_SEPARATOR = '\x00\n\x00'
+
+# Patches joined per search batch; later batches are skipped once every
+# quality category has been found
+_PATCH_BATCH_SIZE = 64
+
+
+@dataclass
+class CommitAggregates:
+    """Per-commit counters collected in a single pass over the commit list."""
+    
+    total_commits: int = 0
+    issue_linked_commits: int = 0
+    quality_message_commits: int = 0
+    commits_with_files: int = 0
+    commits_with_tests: int = 0
+    commits_with_docs: int = 0
+    quality_categories: Set[str] = field(default_factory=set)
 
 
 class EngineeringCraftsmanshipAnalyzer:
     """Analyzer for Category 2: Problem-Solving & Engineering Craftsmanship."""
     
-    def __init__(self):
-        """Initialize analyzer with pattern definitions."""
-        self._init_patterns()
-    
-    def _init_patterns(self):
-        """Initialize detection patterns for craftsmanship analysis."""
-        
-        # Commit-issue linking patterns
-        self.issue_linking_patterns = [
-            r'closes?\s+#(\d+)',
-            r'fixes?\s+#(\d+)', 
-            r'resolves?\s+#(\d+)',
-            r'addresses?\s+#(\d+)',
-            r'implements?\s+#(\d+)',
-            r'refs?\s+#(\d+)',
-            r'see\s+#(\d+)',
-            r'related\s+to\s+#(\d+)'
-        ]
-        
-        # Testing file patterns
-        self.test_patterns = [
-            r'test_.*\.py$',
-            r'.*_test\.py$',
-            r'tests?/.*\.py$',
-            r'spec/.*\.py$',
-            r'.*\.test\.(js|ts)$',
-            r'.*\.spec\.(js|ts)$',
-            r'__tests__/.*\.(js|ts)$'
-        ]
-        
-        # Documentation patterns
-        self.doc_patterns = [
-            r'readme.*\.md$',
-            r'docs?/.*\.md$',
-            r'.*\.rst$',
-            r'changelog.*',
-            r'contributing.*',
-            r'license.*'
-        ]
-        
-        # Code quality indicators
-        self.quality_indicators = {
-            'type_hints': [r':\s*\w+\s*=', r'->\s*\w+:', r'typing\.', r'from typing'],
-            'docstrings': [r'""".*?"""', r"'''.*?'''"],
-            'error_handling': [r'try:', r'except', r'raise', r'finally:'],
-            'validation': [r'assert\s+', r'validate', r'check', r'verify'],
-            'logging': [r'log\.|logger\.', r'logging\.']
-        }
+    def _scan_commits(self, commits: Iterable[CommitRecord]) -> CommitAggregates:
+        """
+        Walk the commit list once, collecting every per-commit signal.
+        
+        Args:
+            commits: Commit data (any iterable, e.g. a streaming source; consumed once)
+            
+        Returns:
+            CommitAggregates shared by the commit-based analyses
+        """
+        aggregates = CommitAggregates()
+        patches = []
+        
+        for commit in commits:
+            aggregates.total_commits += 1
+            message = commit.message
+            lowered = message.lower()
+            
+            # Issue linking
+            if _ISSUE_LINK_RE.search(lowered):
+                aggregates.issue_linked_commits += 1
+            
+            # Good commit messages are descriptive and follow conventions
+            if (len(message) > 20 and 
+                not lowered.startswith(('fix', 'update', 'change')) and
+                any(char in message for char in [':','(','['])):
+                aggregates.quality_message_commits += 1
+            
+            files = commit.files
+            if files is None:
+                continue
+            
+            if files:
+                aggregates.commits_with_files += 1
+                filenames = [f['filename'].lower() for f in files]
+                
+                # Count each commit only once per file type
+                if any(_is_test_file(name) for name in filenames):
+                    aggregates.commits_with_tests += 1
+                if any(_is_doc_file(name) for name in filenames):
+                    aggregates.commits_with_docs += 1
+            
+            patches.extend(lowered_patch(file_info) for file_info in files if 'patch' in file_info)
+        
+        # Error handling and defensive programming patterns: one search per
+        # category per batch of patches, instead of one per category per file
+        remaining = dict(_QUALITY_RES)
+        for start in range(0, len(patches), _PATCH_BATCH_SIZE):
+            corpus = _PATCH_SEPARATOR.join(patches[start:start + _PATCH_BATCH_SIZE])
+            for category, indicator in list(remaining.items()):
+                if indicator.search(corpus):
+                    aggregates.quality_categories.add(category)
+                    del remaining[category]
+            if not remaining:
+                break
+        
+        return aggregates
     
-    def analyze_commit_issue_linking(self, commits: List[Dict]) -> float:
+    def analyze_commit_issue_linking(self, commits: List[CommitRecord],
+                                     aggregates: Optional[CommitAggregates] = None) -> float:
         """
         Analyze the ratio of commits that reference issues.
         
         Args:
             commits: List of commit data
+            aggregates: Precomputed commit scan (computed from commits if omitted)
             
         Returns:
             Ratio of commits that link to issues (0-1)
@@ -78,20 +174,11 @@ class EngineeringCraftsmanshipAnalyzer:
         if not commits:
             return 0.0
         
-        linked_commits = 0
+        aggregates = aggregates or self._scan_commits(commits)
         
-        for commit in commits:
-            message = commit.get('message', '')
-            
-            # Check for issue linking patterns
-            for pattern in self.issue_linking_patterns:
-                if re.search(pattern, message, re.IGNORECASE):
-                    linked_commits += 1
-                    break  # Count each commit only once
-        
-        return linked_commits / len(commits)
+        return aggregates.issue_linked_commits / aggregates.total_commits
     
-    def analyze_pr_turnaround_times(self, pull_requests: List[Dict]) -> Dict[str, float]:
+    def analyze_pr_turnaround_times(self, pull_requests: List[PullRequestRecord]) -> Dict[str, float]:
         """
         Analyze PR turnaround times by size category.
         
@@ -101,26 +188,46 @@ class EngineeringCraftsmanshipAnalyzer:
         Returns:
             Dict mapping size category to average turnaround hours
         """
-        size_categories = {'S': [], 'M': [], 'L': []}
+        turnaround_hours = []
+        changed_files = []
+        additions = []
         
         for pr in pull_requests:
-            if pr.get('merged_at') and pr.get('created_at'):
+            if pr.merged_at and pr.created_at:
                 # Calculate turnaround time
-                created = datetime.fromisoformat(pr['created_at'].replace('Z', '+00:00'))
-                merged = datetime.fromisoformat(pr['merged_at'].replace('Z', '+00:00'))
-                turnaround_hours = (merged - created).total_seconds() / 3600
-                
-                # Categorize by size (using file changes and additions)
-                changed_files = pr.get('changed_files', 0)
-                additions = pr.get('additions', 0)
+                created = as_datetime(pr.created_at)
+                merged = as_datetime(pr.merged_at)
+                turnaround_hours.append((merged - created).total_seconds() / 3600)
                 
-                # Size heuristics
-                if changed_files <= 3 and additions <= 100:
-                    size_categories['S'].append(turnaround_hours)
-                elif changed_files <= 10 and additions <= 500:
-                    size_categories['M'].append(turnaround_hours)
-                else:
-                    size_categories['L'].append(turnaround_hours)
+                # Size inputs (file changes and additions)
+                changed_files.append(pr.changed_files)
+                additions.append(pr.additions)
+        
+        if np is not None and turnaround_hours:
+            hours = np.asarray(turnaround_hours, dtype=np.float64)
+            files = np.asarray(changed_files)
+            adds = np.asarray(additions)
+            
+            # Size heuristics as boolean masks
+            small = (files <= 3) & (adds <= 100)
+            medium = ~small & (files <= 10) & (adds <= 500)
+            large = ~(small | medium)
+            
+            return {
+                size: float(hours[mask].mean()) if mask.any() else 0.0
+                for size, mask in (('S', small), ('M', medium), ('L', large))
+            }
+        
+        size_categories = {'S': [], 'M': [], 'L': []}
+        
+        for hours, files, adds in zip(turnaround_hours, changed_files, additions):
+            # Size heuristics
+            if files <= 3 and adds <= 100:
+                size_categories['S'].append(hours)
+            elif files <= 10 and adds <= 500:
+                size_categories['M'].append(hours)
+            else:
+                size_categories['L'].append(hours)
         
         # Calculate averages
         avg_turnarounds = {}
@@ -132,12 +239,14 @@ class EngineeringCraftsmanshipAnalyzer:
         
         return avg_turnarounds
     
-    def analyze_testing_commitment(self, commits: List[Dict]) -> float:
+    def analyze_testing_commitment(self, commits: List[CommitRecord],
+                                   aggregates: Optional[CommitAggregates] = None) -> float:
         """
         Analyze commitment to testing by examining test file changes.
         
         Args:
             commits: List of commit data
+            aggregates: Precomputed commit scan (computed from commits if omitted)
             
         Returns:
             Testing commitment ratio (0-1)
@@ -145,37 +254,22 @@ class EngineeringCraftsmanshipAnalyzer:
         if not commits:
             return 0.0
         
-        commits_with_tests = 0
-        total_commits_with_files = 0
+        aggregates = aggregates or self._scan_commits(commits)
         
-        for commit in commits:
-            if 'files' in commit and commit['files']:
-                total_commits_with_files += 1
-                
-                # Check if any files are test files
-                for file_info in commit['files']:
-                    filename = file_info['filename']
-                    
-                    for pattern in self.test_patterns:
-                        if re.match(pattern, filename, re.IGNORECASE):
-                            commits_with_tests += 1
-                            break  # Count each commit only once
-                    else:
-                        continue
-                    break
-        
-        if total_commits_with_files == 0:
+        if aggregates.commits_with_files == 0:
             return 0.0
         
-        return commits_with_tests / total_commits_with_files
+        return aggregates.commits_with_tests / aggregates.commits_with_files
     
-    def analyze_structured_workflow(self, commits: List[Dict], pull_requests: List[Dict]) -> float:
+    def analyze_structured_workflow(self, commits: List[CommitRecord], pull_requests: List[PullRequestRecord],
+                                    aggregates: Optional[CommitAggregates] = None) -> float:
         """
         Analyze overall structured workflow adherence.
         
         Args:
             commits: List of commit data
             pull_requests: List of PR data
+            aggregates: Precomputed commit scan (computed from commits if omitted)
             
         Returns:
             Structured workflow score (0-1)
@@ -184,23 +278,15 @@ class EngineeringCraftsmanshipAnalyzer:
         
         # 1. Commit message quality
         if commits:
-            quality_messages = 0
-            for commit in commits:
-                message = commit.get('message', '')
-                # Good commit messages are descriptive and follow conventions
-                if (len(message) > 20 and 
-                    not message.lower().startswith(('fix', 'update', 'change')) and
-                    any(char in message for char in [':','(','['])):
-                    quality_messages += 1
-            
-            workflow_indicators.append(quality_messages / len(commits))
+            aggregates = aggregates or self._scan_commits(commits)
+            workflow_indicators.append(aggregates.quality_message_commits / aggregates.total_commits)
         
         # 2. PR description quality
         if pull_requests:
             quality_prs = 0
             for pr in pull_requests:
-                body = pr.get('body', '')
-                title = pr.get('title', '')
+                body = pr.body
+                title = pr.title
                 # Good PRs have descriptions and meaningful titles
                 if len(body) > 50 and len(title) > 10:
                     quality_prs += 1
@@ -211,7 +297,7 @@ class EngineeringCraftsmanshipAnalyzer:
         if pull_requests:
             feature_branch_prs = 0
             for pr in pull_requests:
-                title = pr.get('title', '').lower()
+                title = pr.title.lower()
                 # Look for feature branch indicators
                 if any(keyword in title for keyword in ['feat', 'feature', 'add', 'implement']):
                     feature_branch_prs += 1
@@ -224,7 +310,7 @@ class EngineeringCraftsmanshipAnalyzer:
         else:
             return 0.0
     
-    def analyze_code_review_thoroughness(self, reviews: List[Dict]) -> float:
+    def analyze_code_review_thoroughness(self, reviews: List[ReviewRecord]) -> float:
         """
         Analyze thoroughness of code reviews given by the user.
         
@@ -240,8 +326,8 @@ class EngineeringCraftsmanshipAnalyzer:
         thoroughness_scores = []
         
         for review in reviews:
-            body = review.get('body', '')
-            state = review.get('state', '')
+            body = review.body
+            state = review.state
             
             score = 0.0
             
@@ -272,12 +358,14 @@ class EngineeringCraftsmanshipAnalyzer:
         
         return sum(thoroughness_scores) / len(thoroughness_scores)
     
-    def analyze_documentation_quality(self, commits: List[Dict]) -> float:
+    def analyze_documentation_quality(self, commits: List[CommitRecord],
+                                      aggregates: Optional[CommitAggregates] = None) -> float:
         """
         Analyze documentation quality and maintenance.
         
         Args:
             commits: List of commit data
+            aggregates: Precomputed commit scan (computed from commits if omitted)
             
         Returns:
             Documentation quality score (0-1)
@@ -285,55 +373,28 @@ class EngineeringCraftsmanshipAnalyzer:
         if not commits:
             return 0.0
         
-        doc_commits = 0
-        total_commits_with_files = 0
+        aggregates = aggregates or self._scan_commits(commits)
         
-        for commit in commits:
-            if 'files' in commit and commit['files']:
-                total_commits_with_files += 1
-                
-                # Check for documentation files
-                for file_info in commit['files']:
-                    filename = file_info['filename'].lower()
-                    
-                    for pattern in self.doc_patterns:
-                        if re.match(pattern, filename, re.IGNORECASE):
-                            doc_commits += 1
-                            break
-                    else:
-                        continue
-                    break
-        
-        if total_commits_with_files == 0:
+        if aggregates.commits_with_files == 0:
             return 0.0
         
-        return doc_commits / total_commits_with_files
+        return aggregates.commits_with_docs / aggregates.commits_with_files
     
-    def analyze_error_handling_patterns(self, commits: List[Dict]) -> List[str]:
+    def analyze_error_handling_patterns(self, commits: List[CommitRecord],
+                                        aggregates: Optional[CommitAggregates] = None) -> List[str]:
         """
         Analyze error handling and defensive programming patterns.
         
         Args:
             commits: List of commit data
+            aggregates: Precomputed commit scan (computed from commits if omitted)
             
         Returns:
             List of error handling patterns found
         """
-        patterns_found = set()
+        aggregates = aggregates or self._scan_commits(commits)
         
-        for commit in commits:
-            if 'files' in commit:
-                for file_info in commit['files']:
-                    if 'patch' in file_info:
-                        patch_content = file_info['patch']
-                        
-                        # Look for error handling patterns
-                        for category, indicators in self.quality_indicators.items():
-                            for indicator in indicators:
-                                if re.search(indicator, patch_content, re.IGNORECASE):
-                                    patterns_found.add(category)
-        
-        return list(patterns_found)
+        return list(aggregates.quality_categories)
     
     def analyze(self, activity_data: ActivityData) -> EngineeringCraftsmanshipMetrics:
         """
@@ -351,14 +412,17 @@ class EngineeringCraftsmanshipAnalyzer:
         pull_requests = activity_data.pull_requests
         reviews = activity_data.reviews
         
+        # Single pass over commits feeds every commit-based analysis
+        aggregates = self._scan_commits(commits)
+        
         # Perform all analyses
-        commit_issue_linking_ratio = self.analyze_commit_issue_linking(commits)
+        commit_issue_linking_ratio = self.analyze_commit_issue_linking(commits, aggregates)
         pr_turnaround_times = self.analyze_pr_turnaround_times(pull_requests)
-        testing_commitment_ratio = self.analyze_testing_commitment(commits)
-        structured_workflow_score = self.analyze_structured_workflow(commits, pull_requests)
+        testing_commitment_ratio = self.analyze_testing_commitment(commits, aggregates)
+        structured_workflow_score = self.analyze_structured_workflow(commits, pull_requests, aggregates)
         code_review_thoroughness = self.analyze_code_review_thoroughness(reviews)
-        documentation_quality_score = self.analyze_documentation_quality(commits)
-        error_handling_patterns = self.analyze_error_handling_patterns(commits)
+        documentation_quality_score = self.analyze_documentation_quality(commits, aggregates)
+        error_handling_patterns = self.analyze_error_handling_patterns(commits, aggregates)
         
         # Create metrics object
         metrics = EngineeringCraftsmanshipMetrics(
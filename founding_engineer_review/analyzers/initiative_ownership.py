@@ -6,51 +6,117 @@ Analyzes self-directed work cycles, first responder behavior, and ownership indi
 """
 
 import re
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Set, Tuple
-from collections import defaultdict
+from typing import Iterable, List, Optional, Set, Tuple
 
-from ..models.metrics import InitiativeOwnershipMetrics, ActivityData
+from ..models.metrics import (
+    InitiativeOwnershipMetrics, ActivityData, CommitRecord, PullRequestRecord, CommentRecord, IssueRecord
+)
+from .keyword_matcher import KeywordMatcher
+
+
+# Commit/PR phrases that close out an issue (matched against lowercased text)
+_ISSUE_CLOSE_RE = re.compile(r'(?:closes?|fixes?|resolves?|implements?)\s+#(\d+)')
+
+# Well-known open source organizations
+_KNOWN_OSS_ORGS = frozenset({
+    'pytorch', 'tensorflow', 'huggingface', 'microsoft', 'google',
+    'facebook', 'apache', 'numpy', 'pandas', 'scikit-learn',
+    'kubernetes', 'docker', 'rust-lang', 'python', 'golang'
+})
+
+# Ownership-indicating keywords in commits/issues
+_OWNERSHIP_KEYWORDS = (
+    'implement', 'create', 'build', 'develop', 'design',
+    'architect', 'refactor', 'optimize', 'improve',
+    'introduce', 'add', 'enhance', 'extend'
+)
+
+# Problem identification keywords
+_PROBLEM_KEYWORDS = (
+    'fix', 'bug', 'issue', 'problem', 'error', 'broken',
+    'performance', 'slow', 'memory', 'leak', 'crash'
+)
+
+# Innovation/learning keywords
+_INNOVATION_KEYWORDS = (
+    'experiment', 'try', 'explore', 'research', 'investigate',
+    'prototype', 'poc', 'proof of concept', 'spike',
+    'new', 'novel', 'alternative', 'better'
+)
+
+# Personal project indicators
+_PERSONAL_PROJECT_INDICATORS = (
+    'learning', 'practice', 'tutorial', 'example',
+    'demo', 'sample', 'test', 'experiment',
+    'my', 'personal', 'side', 'hobby'
+)
+
+# Single matcher over every keyword family used by the analyses below,
+# built once at import time and shared by all analyzer instances
+_KEYWORD_MATCHER = KeywordMatcher({
+    'ownership': _OWNERSHIP_KEYWORDS,
+    'problem': _PROBLEM_KEYWORDS,
+    'innovation': _INNOVATION_KEYWORDS,
+    'repo_quality': ('doc', 'test', 'readme', 'ci'),
+    'alternative_solution': ('alternative', 'different approach', 'better way')
+})
+
+# Comment phrases that indicate a helpful first response (matched against
+# lowercased text; word boundaries keep e.g. 'outlet media' from matching 'let me')
+_HELPFUL_RE = re.compile(
+    r"\b(?:i can help|let me|i'll take|working on|investigating|"
+    r"reproduced|confirmed|looks like|the issue is|try this)\b"
+)
+
+
+@dataclass
+class CommitAggregates:
+    """Per-commit signals collected in a single pass over the commit list."""
+    
+    total_commits: int = 0
+    ownership_commits: int = 0
+    problem_commits: int = 0
+    innovation_commits: int = 0
+    referenced_issues: Set[int] = field(default_factory=set)
 
 
 class InitiativeOwnershipAnalyzer:
     """Analyzer for Category 3: Initiative, Curiosity & Product Sense."""
     
-    def __init__(self):
-        """Initialize analyzer with ownership detection patterns."""
-        self._init_patterns()
-    
-    def _init_patterns(self):
-        """Initialize patterns for detecting ownership and initiative."""
-        
-        # Ownership-indicating keywords in commits/issues
-        self.ownership_keywords = [
-            'implement', 'create', 'build', 'develop', 'design',
-            'architect', 'refactor', 'optimize', 'improve',
-            'introduce', 'add', 'enhance', 'extend'
-        ]
-        
-        # Problem identification keywords
-        self.problem_keywords = [
-            'fix', 'bug', 'issue', 'problem', 'error', 'broken',
-            'performance', 'slow', 'memory', 'leak', 'crash'
-        ]
-        
-        # Innovation/learning keywords
-        self.innovation_keywords = [
-            'experiment', 'try', 'explore', 'research', 'investigate',
-            'prototype', 'poc', 'proof of concept', 'spike',
-            'new', 'novel', 'alternative', 'better'
-        ]
-        
-        # Personal project indicators
-        self.personal_project_indicators = [
-            'learning', 'practice', 'tutorial', 'example',
-            'demo', 'sample', 'test', 'experiment',
-            'my', 'personal', 'side', 'hobby'
-        ]
+    def _scan_commits(self, commits: Iterable[CommitRecord]) -> CommitAggregates:
+        """
+        Walk the commit list once, collecting every per-commit signal.
+        
+        Args:
+            commits: Commit data (any iterable, e.g. a streaming source; consumed once)
+            
+        Returns:
+            CommitAggregates shared by the commit-based analyses
+        """
+        aggregates = CommitAggregates()
+        
+        for commit in commits:
+            aggregates.total_commits += 1
+            message = commit.message.lower()
+            
+            matches = _ISSUE_CLOSE_RE.findall(message)
+            if matches:
+                aggregates.referenced_issues.update(map(int, matches))
+            
+            found = _KEYWORD_MATCHER.match(message)
+            if 'ownership' in found:
+                aggregates.ownership_commits += 1
+            if 'problem' in found:
+                aggregates.problem_commits += 1
+            if 'innovation' in found:
+                aggregates.innovation_commits += 1
+        
+        return aggregates
     
-    def analyze_self_directed_work_cycles(self, issues: List[Dict], pull_requests: List[Dict], commits: List[Dict]) -> Tuple[int, List[str]]:
+    def analyze_self_directed_work_cycles(self, issues: List[IssueRecord], pull_requests: List[PullRequestRecord], commits: List[CommitRecord],
+                                          aggregates: Optional[CommitAggregates] = None) -> Tuple[int, List[str]]:
         """
         Identify self-directed work cycles where user creates issue and resolves it.
         
@@ -58,6 +124,7 @@ class InitiativeOwnershipAnalyzer:
             issues: List of issue data
             pull_requests: List of PR data  
             commits: List of commit data
+            aggregates: Precomputed commit scan (computed from commits if omitted)
             
         Returns:
             Tuple of (cycle_count, ownership_indicators)
@@ -66,41 +133,20 @@ class InitiativeOwnershipAnalyzer:
         ownership_indicators = []
         
         # Extract issue numbers from user's issues
-        user_issues = set()
-        for issue in issues:
-            user_issues.add(issue.get('number'))
+        user_issues = {issue.number for issue in issues}
         
-        # Look for commits/PRs that reference these issues
-        issue_linking_patterns = [
-            r'closes?\s+#(\d+)',
-            r'fixes?\s+#(\d+)', 
-            r'resolves?\s+#(\d+)',
-            r'implements?\s+#(\d+)'
-        ]
-        
-        resolved_issues = set()
+        aggregates = aggregates or self._scan_commits(commits)
         
-        # Check commits for issue resolution
-        for commit in commits:
-            message = commit.get('message', '')
-            
-            for pattern in issue_linking_patterns:
-                matches = re.findall(pattern, message, re.IGNORECASE)
-                for match in matches:
-                    issue_num = int(match)
-                    if issue_num in user_issues:
-                        resolved_issues.add(issue_num)
+        # Look for commits/PRs that reference these issues
+        resolved_issues = aggregates.referenced_issues & user_issues
         
         # Check PRs for issue resolution
         for pr in pull_requests:
-            body = pr.get('body', '') + ' ' + pr.get('title', '')
-            
-            for pattern in issue_linking_patterns:
-                matches = re.findall(pattern, body, re.IGNORECASE)
-                for match in matches:
-                    issue_num = int(match)
-                    if issue_num in user_issues:
-                        resolved_issues.add(issue_num)
+            # Scan body and title separately rather than allocating a joined copy
+            for text in (pr.body, pr.title):
+                matches = _ISSUE_CLOSE_RE.findall(text.lower())
+                if matches:
+                    resolved_issues |= user_issues.intersection(map(int, matches))
         
         cycles = len(resolved_issues)
         
@@ -109,18 +155,14 @@ class InitiativeOwnershipAnalyzer:
             ownership_indicators.append(f"Self-directed cycles: Created and resolved {cycles} issues")
         
         # Additional ownership signals from commit messages
-        ownership_commits = 0
-        for commit in commits:
-            message = commit.get('message', '').lower()
-            if any(keyword in message for keyword in self.ownership_keywords):
-                ownership_commits += 1
+        ownership_commits = aggregates.ownership_commits
         
         if ownership_commits > len(commits) * 0.3:  # More than 30% of commits show ownership
             ownership_indicators.append(f"High ownership language: {ownership_commits}/{len(commits)} commits")
         
         return cycles, ownership_indicators
     
-    def analyze_first_responder_behavior(self, comments: List[Dict], activity_data: ActivityData) -> int:
+    def analyze_first_responder_behavior(self, comments: List[CommentRecord], activity_data: ActivityData) -> int:
         """
         Analyze first responder behavior on issues/PRs the user didn't create.
         
@@ -137,23 +179,8 @@ class InitiativeOwnershipAnalyzer:
         first_responder_count = 0
         
         # Look for comment patterns that indicate helpful first responses
-        helpful_patterns = [
-            r'i can help',
-            r'let me',
-            r'i\'ll take',
-            r'working on',
-            r'investigating',
-            r'reproduced',
-            r'confirmed',
-            r'looks like',
-            r'the issue is',
-            r'try this'
-        ]
-        
         for comment in comments:
-            comment_body = comment.get('comment_body', '').lower()
-            
-            if any(re.search(pattern, comment_body) for pattern in helpful_patterns):
+            if _HELPFUL_RE.search(comment.comment_body.lower()):
                 first_responder_count += 1
         
         return first_responder_count
@@ -168,46 +195,47 @@ class InitiativeOwnershipAnalyzer:
         Returns:
             Tuple of (quality_score, learning_indicators)
         """
-        repo_analysis = defaultdict(lambda: {'commits': 0, 'innovation': 0, 'quality': 0})
         learning_indicators = []
         
-        # Analyze repository involvement
-        for repo, activity_count in activity_data.repository_involvement.items():
-            # Skip very low activity repos
-            if activity_count < 3:
+        # Per-repo counters as parallel lists indexed by repository position
+        # (very low activity repos are skipped)
+        repos = [repo for repo, activity_count in activity_data.repository_involvement.items()
+                 if activity_count >= 3]
+        if not repos:
+            return 0.0, learning_indicators
+        
+        repo_index = {repo: i for i, repo in enumerate(repos)}
+        commit_counts = [activity_data.repository_involvement[repo] for repo in repos]
+        innovation_counts = [0] * len(repos)
+        quality_counts = [0] * len(repos)
+        
+        # Look for innovation signals in each tracked repo's commits
+        for commit in activity_data.commits:
+            i = repo_index.get(commit.repository)
+            if i is None:
                 continue
             
-            repo_analysis[repo]['commits'] = activity_count
+            found = _KEYWORD_MATCHER.match(commit.message.lower())
             
-            # Look for innovation signals in commits related to this repo
-            for commit in activity_data.commits:
-                if commit.get('repository') == repo:
-                    message = commit.get('message', '').lower()
-                    
-                    # Innovation indicators
-                    if any(keyword in message for keyword in self.innovation_keywords):
-                        repo_analysis[repo]['innovation'] += 1
-                    
-                    # Quality indicators (documentation, tests, structure)
-                    if any(keyword in message for keyword in ['doc', 'test', 'readme', 'ci']):
-                        repo_analysis[repo]['quality'] += 1
+            # Innovation indicators
+            if 'innovation' in found:
+                innovation_counts[i] += 1
+            
+            # Quality indicators (documentation, tests, structure)
+            if 'repo_quality' in found:
+                quality_counts[i] += 1
         
         # Calculate overall quality score
-        if not repo_analysis:
-            return 0.0, learning_indicators
-        
         quality_scores = []
-        for repo, metrics in repo_analysis.items():
-            if metrics['commits'] > 0:
-                innovation_ratio = metrics['innovation'] / metrics['commits']
-                quality_ratio = metrics['quality'] / metrics['commits']
-                repo_score = (innovation_ratio + quality_ratio) / 2
-                quality_scores.append(repo_score)
-                
-                if innovation_ratio > 0.2:
-                    learning_indicators.append(f"Experimental work in {repo}")
-                if quality_ratio > 0.3:
-                    learning_indicators.append(f"Quality focus in {repo}")
+        for repo, commits, innovation, quality in zip(repos, commit_counts, innovation_counts, quality_counts):
+            innovation_ratio = innovation / commits
+            quality_ratio = quality / commits
+            quality_scores.append((innovation_ratio + quality_ratio) / 2)
+            
+            if innovation_ratio > 0.2:
+                learning_indicators.append(f"Experimental work in {repo}")
+            if quality_ratio > 0.3:
+                learning_indicators.append(f"Quality focus in {repo}")
         
         overall_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0.0
         
@@ -226,20 +254,13 @@ class InitiativeOwnershipAnalyzer:
         contribution_count = 0
         contribution_evidence = []
         
-        # Well-known open source organizations/repos
-        known_oss_orgs = {
-            'pytorch', 'tensorflow', 'huggingface', 'microsoft', 'google',
-            'facebook', 'apache', 'numpy', 'pandas', 'scikit-learn',
-            'kubernetes', 'docker', 'rust-lang', 'python', 'golang'
-        }
-        
         # Analyze repository involvement for OSS contributions
         for repo in activity_data.repository_involvement.keys():
             repo_lower = repo.lower()
             org = repo.split('/')[0].lower() if '/' in repo else repo.lower()
             
             # Check if it's a known OSS project
-            if org in known_oss_orgs:
+            if org in _KNOWN_OSS_ORGS:
                 contribution_count += 1
                 contribution_evidence.append(f"Contributed to {repo}")
             
@@ -251,8 +272,9 @@ class InitiativeOwnershipAnalyzer:
         # Analyze PRs for external contributions
         external_prs = 0
         for pr in activity_data.pull_requests:
-            repo = pr.get('repository', '')
-            if repo and any(org in repo.lower() for org in known_oss_orgs):
+            repo = pr.repository
+            # Repository names are 'org/name', so the org is a single set lookup
+            if repo and repo.split('/', 1)[0].lower() in _KNOWN_OSS_ORGS:
                 external_prs += 1
         
         if external_prs > 0:
@@ -260,13 +282,15 @@ class InitiativeOwnershipAnalyzer:
         
         return contribution_count, contribution_evidence
     
-    def analyze_problem_identification_score(self, issues: List[Dict], commits: List[Dict]) -> float:
+    def analyze_problem_identification_score(self, issues: List[IssueRecord], commits: List[CommitRecord],
+                                             aggregates: Optional[CommitAggregates] = None) -> float:
         """
         Analyze ability to identify and articulate problems.
         
         Args:
             issues: List of issue data
             commits: List of commit data
+            aggregates: Precomputed commit scan (computed from commits if omitted)
             
         Returns:
             Problem identification score (0-1)
@@ -277,11 +301,11 @@ class InitiativeOwnershipAnalyzer:
         # Analyze issue creation for problem identification
         for issue in issues:
             total_signals += 1
-            title = issue.get('title', '').lower()
-            body = issue.get('body', '').lower()
+            title = issue.title.lower()
+            body = issue.body.lower()
             
             # Look for clear problem statements
-            if any(keyword in title + ' ' + body for keyword in self.problem_keywords):
+            if 'problem' in _KEYWORD_MATCHER.match(title + ' ' + body):
                 problem_identification_signals += 1
             
             # Look for detailed problem descriptions
@@ -289,25 +313,24 @@ class InitiativeOwnershipAnalyzer:
                 problem_identification_signals += 0.5
         
         # Analyze commits for problem-solving patterns
-        for commit in commits:
-            total_signals += 1
-            message = commit.get('message', '').lower()
-            
-            if any(keyword in message for keyword in self.problem_keywords):
-                problem_identification_signals += 1
+        aggregates = aggregates or self._scan_commits(commits)
+        total_signals += aggregates.total_commits
+        problem_identification_signals += aggregates.problem_commits
         
         if total_signals == 0:
             return 0.0
         
         return min(problem_identification_signals / total_signals, 1.0)
     
-    def analyze_solution_creativity(self, commits: List[Dict], pull_requests: List[Dict]) -> List[str]:
+    def analyze_solution_creativity(self, commits: List[CommitRecord], pull_requests: List[PullRequestRecord],
+                                    aggregates: Optional[CommitAggregates] = None) -> List[str]:
         """
         Analyze creativity and innovation in solutions.
         
         Args:
             commits: List of commit data
             pull_requests: List of PR data
+            aggregates: Precomputed commit scan (computed from commits if omitted)
             
         Returns:
             List of creativity indicators
@@ -315,12 +338,8 @@ class InitiativeOwnershipAnalyzer:
         creativity_indicators = []
         
         # Look for innovative approaches in commit messages
-        innovation_count = 0
-        for commit in commits:
-            message = commit.get('message', '').lower()
-            
-            if any(keyword in message for keyword in self.innovation_keywords):
-                innovation_count += 1
+        aggregates = aggregates or self._scan_commits(commits)
+        innovation_count = aggregates.innovation_commits
         
         if innovation_count > len(commits) * 0.15:  # More than 15% show innovation
             creativity_indicators.append(f"Experimental approach: {innovation_count} innovative commits")
@@ -328,13 +347,14 @@ class InitiativeOwnershipAnalyzer:
         # Analyze PR descriptions for creative solutions
         creative_prs = 0
         for pr in pull_requests:
-            body = pr.get('body', '').lower()
+            body = pr.body.lower()
+            found = _KEYWORD_MATCHER.match(body)
             
-            if any(keyword in body for keyword in self.innovation_keywords):
+            if 'innovation' in found:
                 creative_prs += 1
             
             # Look for alternative solution discussions
-            if any(phrase in body for phrase in ['alternative', 'different approach', 'better way']):
+            if 'alternative_solution' in found:
                 creative_prs += 1
         
         if creative_prs > 0:
@@ -359,9 +379,12 @@ class InitiativeOwnershipAnalyzer:
         pull_requests = activity_data.pull_requests
         comments = activity_data.comments
         
+        # Single pass over commits feeds every commit-based analysis
+        aggregates = self._scan_commits(commits)
+        
         # Perform all analyses
         self_directed_cycles, ownership_indicators = self.analyze_self_directed_work_cycles(
-            issues, pull_requests, commits
+            issues, pull_requests, commits, aggregates
         )
         
         first_responder_instances = self.analyze_first_responder_behavior(comments, activity_data)
@@ -370,9 +393,9 @@ class InitiativeOwnershipAnalyzer:
         
         open_source_contributions, contribution_evidence = self.analyze_open_source_contributions(activity_data)
         
-        problem_identification_score = self.analyze_problem_identification_score(issues, commits)
+        problem_identification_score = self.analyze_problem_identification_score(issues, commits, aggregates)
         
-        solution_creativity_indicators = self.analyze_solution_creativity(commits, pull_requests)
+        solution_creativity_indicators = self.analyze_solution_creativity(commits, pull_requests, aggregates)
         
         # Combine all ownership indicators
         all_ownership_indicators = ownership_indicators + learning_indicators + contribution_evidence
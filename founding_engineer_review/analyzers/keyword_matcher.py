@@ -0,0 +1,78 @@
+"""
+Keyword Matcher
+
+Multi-category substring matching shared by the analyzers. When pyahocorasick
+is installed all keywords are compiled into a single Aho-Corasick automaton,
+so a text is scanned once regardless of how many keywords are registered.
+"""
+
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, Iterable, Set
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
+
+# Automaton hits are (end_index, owning categories) pairs
+_owners = itemgetter(1)
+
+
+class KeywordMatcher:
+    """Find which keyword categories occur (as substrings) in a text."""
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        """
+        Build the matcher.
+
+        Args:
+            categories: Mapping of category name to its keywords
+        """
+        self.categories = {category: tuple(keywords) for category, keywords in categories.items()}
+        self._automaton = None
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for category, keywords in self.categories.items():
+                for keyword in keywords:
+                    owners = automaton.get(keyword, frozenset())
+                    automaton.add_word(keyword, owners | {category})
+            if len(automaton):
+                automaton.make_automaton()
+                self._automaton = automaton
+
+    @classmethod
+    def for_keywords(cls, keywords: Iterable[str]) -> 'KeywordMatcher':
+        """
+        Build a matcher whose categories are the keywords themselves.
+
+        match() then returns the set of keywords found in the text.
+
+        Args:
+            keywords: Keywords to look for
+
+        Returns:
+            KeywordMatcher with one single-keyword category per keyword
+        """
+        return cls({keyword: (keyword,) for keyword in keywords})
+
+    def match(self, text: str) -> Set[str]:
+        """
+        Return the set of categories with at least one keyword in text.
+
+        Args:
+            text: Text to scan (callers lowercase it when matching is case-insensitive)
+
+        Returns:
+            Set of matched category names
+        """
+        if self._automaton is not None:
+            # Flatten the (end_index, owners) hits entirely in C: no Python-level
+            # loop body runs per match, even on large patches
+            return set(chain.from_iterable(map(_owners, self._automaton.iter(text))))
+
+        return {
+            category for category, keywords in self.categories.items()
+            if any(keyword in text for keyword in keywords)
+        }
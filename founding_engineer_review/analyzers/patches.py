@@ -0,0 +1,39 @@
+"""
+Patch Helpers
+
+Shared access to commit file patches for the analyzers. Several analyzers
+match against the lowercased patch text, so it is computed once per file
+entry and memoized on the entry.
+
+Patches stay str rather than bytes: ASCII diff text is already stored one
+byte per character (PEP 393), str.lower() has an ASCII fast path, and the
+pyahocorasick automaton behind KeywordMatcher takes str keys. Encoding to
+bytes would add a copy without making the scans cheaper.
+"""
+
+from typing import Any, Dict, Optional
+
+
+# Only the first 64 KB of a patch is scanned. Generated or vendored diffs can
+# run to megabytes and would dominate every scan without adding signal.
+PATCH_SCAN_LIMIT = 64 * 1024
+
+
+def lowered_patch(file_info: Dict[str, Any]) -> Optional[str]:
+    """
+    Return the lowercased patch of a commit file entry, memoized on the entry.
+
+    Patches longer than PATCH_SCAN_LIMIT characters are truncated first. The
+    lowercased text is stored under '_patch_lower' so later scans (in this or
+    another analyzer) reuse it instead of lowering the patch again.
+
+    Args:
+        file_info: Commit file entry as produced by the data source
+
+    Returns:
+        Lowercased patch text, or None if the entry has no patch
+    """
+    lowered = file_info.get('_patch_lower')
+    if lowered is None and 'patch' in file_info:
+        lowered = file_info['_patch_lower'] = file_info['patch'][:PATCH_SCAN_LIMIT].lower()
+    return lowered
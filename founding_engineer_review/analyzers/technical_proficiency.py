@@ -6,16 +6,83 @@ Analyzes dependency sophistication, framework usage, and code complexity.
 """
 
 import re
-import os
-from typing import Dict, List, Tuple, Set
-from collections import defaultdict, Counter
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Set
+from collections import Counter
 
-from ..models.metrics import TechnicalProficiencyMetrics, ActivityData
+from ..models.metrics import TechnicalProficiencyMetrics, ActivityData, CommitRecord
+from .keyword_matcher import KeywordMatcher
+from .patches import lowered_patch
+
+
+# Matcher category prefix for the literals each complexity regex requires
+_ANCHOR = 'anchor:'
+
+# Pattern-based complexity indicators, compiled once (matched against
+# lowercased patches; '[^\n]' keeps each match on a single line like '.').
+# Every match contains all of its anchor literals, so the regex only runs
+# when the complexity matcher has already seen each of them in the patch.
+_COMPLEXITY_RES = tuple(
+    (indicator, frozenset(_ANCHOR + literal for literal in anchors), re.compile(pattern))
+    for indicator, anchors, pattern in (
+        ('inheritance', ('class', '):'), r'class[^\n(]*\([^\n]*\):'),
+        ('decorators', ('@',), r'@\w+'),
+        ('generators', ('def', 'yield'), r'def[^\n]*yield'),
+        ('context_managers', ('with', 'as'), r'with[^\n]*as'),
+    )
+)
+_COMPLEXITY_ANCHORS = frozenset().union(*(anchors for _, anchors, _ in _COMPLEXITY_RES))
+
+
+def _split_filename(path: str) -> Tuple[str, str]:
+    """
+    Return (basename, extension) of a '/'-separated repository path.
+    
+    Same result as os.path.basename/os.path.splitext (leading dots do not
+    start an extension) without the posixpath call overhead.
+    """
+    basename = path[path.rfind('/') + 1:]
+    dot = basename.rfind('.')
+    if dot > 0 and basename[:dot].lstrip('.'):
+        return basename, basename[dot:]
+    return basename, ''
+
+
+# Layer each file extension belongs to, for full-stack evidence
+_FILE_TYPES = {
+    '.py': 'backend', '.js': 'backend', '.ts': 'backend', '.go': 'backend', '.rs': 'backend',
+    '.html': 'frontend', '.css': 'frontend', '.jsx': 'frontend', '.tsx': 'frontend', '.vue': 'frontend',
+    '.yml': 'infrastructure', '.yaml': 'infrastructure',
+    '.sql': 'database', '.db': 'database'
+}
+
+# Word tokens in lowercased commit messages; API/infra keywords are all alphanumeric
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+
+@dataclass
+class CommitAggregates:
+    """Per-file signals collected in a single pass over the commit list."""
+    
+    dependency_changes: int = 0
+    advanced_frameworks: int = 0
+    framework_usage: Counter = field(default_factory=Counter)
+    language_stats: Counter = field(default_factory=Counter)
+    file_types_seen: Set[str] = field(default_factory=set)
+    frameworks_found: Set[str] = field(default_factory=set)
+    infra_found: Set[str] = field(default_factory=set)
+    complexity_found: Set[str] = field(default_factory=set)
+    production_counts: Counter = field(default_factory=Counter)
 
 
 class TechnicalProficiencyAnalyzer:
     """Analyzer for Category 1: Core AI/ML Technical Proficiency."""
     
+    # Frameworks that count towards dependency sophistication
+    ADVANCED_FRAMEWORKS = frozenset({
+        'triton', 'tensorrt', 'mlflow', 'dvc', 'wandb', 'ray', 'kubeflow', 'optuna'
+    })
+    
     def __init__(self):
         """Initialize analyzer with technology detection patterns."""
         self._init_tech_patterns()
@@ -24,7 +91,7 @@ class TechnicalProficiencyAnalyzer:
         """Initialize technology detection patterns."""
         
         # AI/ML frameworks (comprehensive list)
-        self.ai_ml_frameworks = {
+        self.ai_ml_frameworks = frozenset({
             # Deep Learning Frameworks
             'torch', 'pytorch', 'tensorflow', 'tf', 'jax', 'flax', 'keras',
             'mxnet', 'paddle', 'oneflow', 'mindspore',
@@ -51,7 +118,13 @@ class TechnicalProficiencyAnalyzer:
             
             # Audio/Speech
             'librosa', 'torchaudio', 'soundfile', 'whisper', 'espnet'
-        }
+        })
+        
+        # Dependency manifests, matched against lowercased basenames
+        self.dependency_files = frozenset({
+            'requirements.txt', 'pyproject.toml', 'setup.py', 'environment.yml',
+            'pipfile', 'poetry.lock', 'package.json', 'cargo.toml', 'go.mod'
+        })
         
         # Performance languages by file extension
         self.performance_languages = {
@@ -67,71 +140,199 @@ class TechnicalProficiencyAnalyzer:
         }
         
         # API and web frameworks
-        self.api_frameworks = {
+        self.api_frameworks = frozenset({
             'fastapi', 'flask', 'django', 'starlette', 'aiohttp',
             'tornado', 'bottle', 'falcon', 'sanic',
             'grpc', 'graphql', 'rest', 'restful'
-        }
+        })
         
         # Infrastructure and deployment keywords
-        self.infra_keywords = {
+        self.infra_keywords = frozenset({
             'docker', 'kubernetes', 'k8s', 'terraform', 'helm',
             'aws', 'gcp', 'azure', 'cloud', 'serverless',
             'lambda', 'ec2', 's3', 'rds', 'redis',
             'postgres', 'mongodb', 'elasticsearch',
             'nginx', 'apache', 'gunicorn', 'uvicorn',
             'celery', 'airflow', 'kafka', 'rabbitmq'
-        }
+        })
         
         # Advanced code complexity indicators
-        self.complexity_indicators = {
+        self.complexity_indicators = frozenset({
             'async', 'await', 'asyncio', 'threading', 'multiprocessing',
             'concurrent', 'parallel', 'distributed', 'queue',
             'decorator', 'metaclass', 'generator', 'yield',
             'context manager', '__enter__', '__exit__',
             'property', 'classmethod', 'staticmethod',
             'inheritance', 'polymorphism', 'abstraction'
+        })
+        
+        # Production readiness patterns by category
+        self.production_patterns = {
+            'logging': ['logging', 'logger', 'log.', 'debug', 'info', 'warning', 'error'],
+            'error_handling': ['try:', 'except:', 'raise', 'exception', 'error'],
+            'testing': ['test_', 'unittest', 'pytest', 'mock', 'assert'],
+            'configuration': ['config', 'settings', 'env', 'environment'],
+            'monitoring': ['metrics', 'prometheus', 'grafana', 'alert', 'monitor'],
+            'security': ['auth', 'token', 'jwt', 'ssl', 'encrypt', 'secure'],
+            'performance': ['cache', 'redis', 'memcache', 'optimize', 'performance']
+        }
+        
+        # Keyword matchers: each scans a text once for every keyword in its set
+        self.ai_ml_matcher = KeywordMatcher.for_keywords(self.ai_ml_frameworks)
+        # The complexity matcher also reports the regex anchors (as 'anchor:<literal>')
+        self.complexity_matcher = KeywordMatcher({
+            **{indicator: (indicator,) for indicator in self.complexity_indicators},
+            **{anchor: (anchor[len(_ANCHOR):],) for anchor in _COMPLEXITY_ANCHORS}
+        })
+        self.production_matcher = KeywordMatcher.for_keywords(
+            {pattern for patterns in self.production_patterns.values() for pattern in patterns}
+        )
+        
+        # Production pattern -> categories it counts towards ('error' is in two).
+        # Categories count distinct patterns per file, so the fused matcher is
+        # used rather than a named-group regex, whose finditer would count
+        # repeats and could credit an overlapping pattern to only one group.
+        self.production_pattern_categories = {
+            pattern: tuple(category for category, patterns in self.production_patterns.items()
+                           if pattern in patterns)
+            for patterns in self.production_patterns.values() for pattern in patterns
         }
     
-    def analyze_dependency_files(self, commits: List[Dict]) -> Tuple[Dict[str, int], float]:
+    def _scan_commits(self, commits: Iterable[CommitRecord]) -> CommitAggregates:
         """
-        Analyze dependency files for framework sophistication.
+        Walk commits and their files once, collecting every per-file signal.
+        
+        Each patch is lowercased once and scanned by every keyword matcher,
+        instead of once per analysis.
         
         Args:
-            commits: List of commit data
+            commits: Commit data (any iterable, e.g. a streaming source; consumed once)
             
         Returns:
-            Tuple of (framework_usage_counts, sophistication_score)
+            CommitAggregates shared by the commit-based analyses
         """
-        framework_usage = defaultdict(int)
-        dependency_files = [
-            'requirements.txt', 'pyproject.toml', 'setup.py', 'environment.yml',
-            'Pipfile', 'poetry.lock', 'package.json', 'Cargo.toml', 'go.mod'
-        ]
-        
-        dependency_changes = 0
-        advanced_frameworks = 0
+        aggregates = CommitAggregates()
+        
+        # Identical patches (vendored files, repeated boilerplate) are scanned
+        # once per run: lowered patch -> (production patterns, complexity indicators)
+        patch_scans = {}
+        
+        # Bind per-file lookups to locals; this loop runs for every file in the window
+        api_frameworks = self.api_frameworks
+        infra_keywords = self.infra_keywords
+        dependency_files = self.dependency_files
+        advanced_frameworks = self.ADVANCED_FRAMEWORKS
+        performance_languages = self.performance_languages
+        match_ai_ml = self.ai_ml_matcher.match
+        match_production = self.production_matcher.match
+        pattern_categories = self.production_pattern_categories
+        framework_usage = aggregates.framework_usage
+        language_stats = aggregates.language_stats
+        file_types_seen = aggregates.file_types_seen
+        complexity_found = aggregates.complexity_found
+        production_counts = aggregates.production_counts
         
         for commit in commits:
-            if 'files' in commit:
-                for file_info in commit['files']:
-                    filename = os.path.basename(file_info['filename']).lower()
+            commit_message = commit.message.lower()
+            
+            # Check commit message for API/infra keywords (whole words only)
+            tokens = set(_WORD_RE.findall(commit_message))
+            aggregates.frameworks_found |= api_frameworks & tokens
+            aggregates.infra_found |= infra_keywords & tokens
+            
+            if commit.files is None:
+                continue
+            
+            for file_info in commit.files:
+                filename = file_info['filename'].lower()
+                patch_content = lowered_patch(file_info)
+                basename, extension = _split_filename(filename)
+                
+                # Dependency files and the frameworks they pull in
+                if basename in dependency_files:
+                    aggregates.dependency_changes += 1
                     
-                    if filename in dependency_files:
-                        dependency_changes += 1
+                    if patch_content is not None:
+                        frameworks = match_ai_ml(patch_content)
+                        framework_usage.update(frameworks)
                         
-                        # Analyze patch content for framework additions
-                        if 'patch' in file_info:
-                            patch_content = file_info['patch'].lower()
-                            
-                            for framework in self.ai_ml_frameworks:
-                                if framework in patch_content:
-                                    framework_usage[framework] += 1
-                                    
-                                    # Count advanced frameworks for sophistication score
-                                    if framework in ['triton', 'tensorrt', 'mlflow', 'dvc', 
-                                                   'wandb', 'ray', 'kubeflow', 'optuna']:
-                                        advanced_frameworks += 1
+                        # Count advanced frameworks for sophistication score
+                        aggregates.advanced_frameworks += len(frameworks & advanced_frameworks)
+                
+                # Performance languages (additions as proxy for lines written)
+                language = performance_languages.get(extension)
+                if language:
+                    language_stats[language] += file_info.get('additions', 0)
+                
+                # Categorize file types
+                file_type = _FILE_TYPES.get(extension)
+                if file_type is None and ('dockerfile' in filename or 'docker-compose' in filename):
+                    file_type = 'infrastructure'
+                if file_type:
+                    file_types_seen.add(file_type)
+                
+                # Production readiness looks at "<filename> <patch>"; no pattern
+                # contains a space, so the two parts can be matched separately
+                found_patterns = match_production(filename)
+                
+                if patch_content is not None:
+                    scan = patch_scans.get(patch_content)
+                    if scan is None:
+                        scan = patch_scans[patch_content] = self._scan_patch(
+                            patch_content, complexity_found
+                        )
+                    
+                    patch_patterns, patch_complexity = scan
+                    found_patterns |= patch_patterns
+                    complexity_found |= patch_complexity
+                
+                production_counts.update(
+                    category for pattern in found_patterns
+                    for category in pattern_categories[pattern]
+                )
+        
+        return aggregates
+    
+    def _scan_patch(self, patch_content: str, complexity_found: Set[str]) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """
+        Match one lowercased patch against the production and complexity patterns.
+        
+        Args:
+            patch_content: Lowercased patch text
+            complexity_found: Complexity indicators already found in this run;
+                their regexes are skipped (the set only grows, so a cached
+                result stays valid for the rest of the run)
+            
+        Returns:
+            Tuple of (production patterns, complexity indicators) in the patch
+        """
+        complexity = self.complexity_matcher.match(patch_content)
+        anchors = complexity & _COMPLEXITY_ANCHORS
+        complexity -= anchors
+        
+        # Additional pattern-based detection (skip indicators already found,
+        # and patterns whose anchor literals are missing from the patch)
+        for indicator, required, pattern in _COMPLEXITY_RES:
+            if indicator not in complexity_found and required <= anchors and pattern.search(patch_content):
+                complexity.add(indicator)
+        
+        return frozenset(self.production_matcher.match(patch_content)), frozenset(complexity)
+    
+    def analyze_dependency_files(self, commits: List[CommitRecord],
+                                 aggregates: Optional[CommitAggregates] = None) -> Tuple[Dict[str, int], float]:
+        """
+        Analyze dependency files for framework sophistication.
+        
+        Args:
+            commits: List of commit data
+            aggregates: Precomputed commit scan (computed from commits if omitted)
+            
+        Returns:
+            Tuple of (framework_usage_counts, sophistication_score)
+        """
+        aggregates = aggregates or self._scan_commits(commits)
+        framework_usage = aggregates.framework_usage
+        dependency_changes = aggregates.dependency_changes
         
         # Calculate sophistication score (0-1)
         if dependency_changes == 0:
@@ -139,78 +340,45 @@ class TechnicalProficiencyAnalyzer:
         else:
             # Score based on ratio of advanced frameworks and diversity
             diversity_score = min(len(framework_usage) / 10.0, 1.0)  # Max 10 different frameworks
-            advanced_ratio = min(advanced_frameworks / dependency_changes, 1.0)
+            advanced_ratio = min(aggregates.advanced_frameworks / dependency_changes, 1.0)
             sophistication_score = (diversity_score + advanced_ratio) / 2.0
         
         return dict(framework_usage), sophistication_score
     
-    def analyze_language_distribution(self, commits: List[Dict]) -> Dict[str, int]:
+    def analyze_language_distribution(self, commits: List[CommitRecord],
+                                      aggregates: Optional[CommitAggregates] = None) -> Dict[str, int]:
         """
         Analyze distribution of performance languages.
         
         Args:
             commits: List of commit data
+            aggregates: Precomputed commit scan (computed from commits if omitted)
             
         Returns:
             Dict mapping language to line count
         """
-        language_stats = defaultdict(int)
-        
-        for commit in commits:
-            if 'files' in commit:
-                for file_info in commit['files']:
-                    filename = file_info['filename']
-                    _, ext = os.path.splitext(filename.lower())
-                    
-                    if ext in self.performance_languages:
-                        language = self.performance_languages[ext]
-                        # Use additions as proxy for lines written
-                        language_stats[language] += file_info.get('additions', 0)
+        aggregates = aggregates or self._scan_commits(commits)
         
-        return dict(language_stats)
+        return dict(aggregates.language_stats)
     
-    def analyze_full_stack_evidence(self, commits: List[Dict]) -> List[str]:
+    def analyze_full_stack_evidence(self, commits: List[CommitRecord],
+                                    aggregates: Optional[CommitAggregates] = None) -> List[str]:
         """
         Find evidence of full-stack development capabilities.
         
         Args:
             commits: List of commit data
+            aggregates: Precomputed commit scan (computed from commits if omitted)
             
         Returns:
             List of full-stack evidence strings
         """
+        aggregates = aggregates or self._scan_commits(commits)
         evidence = set()
         
-        # Track different types of files and frameworks
-        file_types_seen = set()
-        frameworks_found = set()
-        infra_found = set()
-        
-        for commit in commits:
-            commit_message = commit.get('message', '').lower()
-            
-            # Check commit message for API/infra keywords
-            for keyword in self.api_frameworks:
-                if keyword in commit_message:
-                    frameworks_found.add(keyword)
-            
-            for keyword in self.infra_keywords:
-                if keyword in commit_message:
-                    infra_found.add(keyword)
-            
-            if 'files' in commit:
-                for file_info in commit['files']:
-                    filename = file_info['filename'].lower()
-                    
-                    # Categorize file types
-                    if any(ext in filename for ext in ['.py', '.js', '.ts', '.go', '.rs']):
-                        file_types_seen.add('backend')
-                    elif any(ext in filename for ext in ['.html', '.css', '.jsx', '.tsx', '.vue']):
-                        file_types_seen.add('frontend')
-                    elif any(name in filename for name in ['dockerfile', 'docker-compose', '.yml', '.yaml']):
-                        file_types_seen.add('infrastructure')
-                    elif any(ext in filename for ext in ['.sql', '.db']):
-                        file_types_seen.add('database')
+        file_types_seen = aggregates.file_types_seen
+        frameworks_found = aggregates.frameworks_found
+        infra_found = aggregates.infra_found
         
         # Generate evidence based on findings
         if len(file_types_seen) >= 3:
@@ -230,82 +398,39 @@ class TechnicalProficiencyAnalyzer:
         
         return list(evidence)
     
-    def analyze_code_complexity(self, commits: List[Dict]) -> List[str]:
+    def analyze_code_complexity(self, commits: List[CommitRecord],
+                                aggregates: Optional[CommitAggregates] = None) -> List[str]:
         """
         Analyze code complexity indicators from patches.
         
         Args:
             commits: List of commit data
+            aggregates: Precomputed commit scan (computed from commits if omitted)
             
         Returns:
             List of complexity indicators found
         """
-        complexity_found = set()
+        aggregates = aggregates or self._scan_commits(commits)
         
-        for commit in commits:
-            if 'files' in commit:
-                for file_info in commit['files']:
-                    if 'patch' in file_info:
-                        patch_content = file_info['patch'].lower()
-                        
-                        # Look for complexity indicators
-                        for indicator in self.complexity_indicators:
-                            if indicator in patch_content:
-                                complexity_found.add(indicator)
-                        
-                        # Additional pattern-based detection
-                        if re.search(r'class.*\(.*\):', patch_content):
-                            complexity_found.add('inheritance')
-                        
-                        if re.search(r'@\w+', patch_content):
-                            complexity_found.add('decorators')
-                        
-                        if re.search(r'def.*yield', patch_content):
-                            complexity_found.add('generators')
-                        
-                        if re.search(r'with.*as', patch_content):
-                            complexity_found.add('context_managers')
-        
-        return list(complexity_found)
+        return list(aggregates.complexity_found)
     
-    def analyze_production_readiness(self, commits: List[Dict]) -> List[str]:
+    def analyze_production_readiness(self, commits: List[CommitRecord],
+                                     aggregates: Optional[CommitAggregates] = None) -> List[str]:
         """
         Analyze signals of production-ready code.
         
         Args:
             commits: List of commit data
+            aggregates: Precomputed commit scan (computed from commits if omitted)
             
         Returns:
             List of production readiness signals
         """
+        aggregates = aggregates or self._scan_commits(commits)
         signals = set()
         
-        production_patterns = {
-            'logging': ['logging', 'logger', 'log.', 'debug', 'info', 'warning', 'error'],
-            'error_handling': ['try:', 'except:', 'raise', 'exception', 'error'],
-            'testing': ['test_', 'unittest', 'pytest', 'mock', 'assert'],
-            'configuration': ['config', 'settings', 'env', 'environment'],
-            'monitoring': ['metrics', 'prometheus', 'grafana', 'alert', 'monitor'],
-            'security': ['auth', 'token', 'jwt', 'ssl', 'encrypt', 'secure'],
-            'performance': ['cache', 'redis', 'memcache', 'optimize', 'performance']
-        }
-        
-        pattern_counts = defaultdict(int)
-        
-        for commit in commits:
-            commit_message = commit.get('message', '').lower()
-            
-            if 'files' in commit:
-                for file_info in commit['files']:
-                    content = f"{file_info['filename']} {file_info.get('patch', '')}".lower()
-                    
-                    for category, patterns in production_patterns.items():
-                        for pattern in patterns:
-                            if pattern in content:
-                                pattern_counts[category] += 1
-        
         # Generate signals based on evidence
-        for category, count in pattern_counts.items():
+        for category, count in aggregates.production_counts.items():
             if count >= 3:  # Threshold for meaningful evidence
                 signals.add(f"{category.replace('_', ' ').title()}: {count} instances")
         
@@ -325,12 +450,15 @@ class TechnicalProficiencyAnalyzer:
         
         commits = activity_data.commits
         
+        # Single pass over commits and files feeds every analysis
+        aggregates = self._scan_commits(commits)
+        
         # Analyze different aspects
-        framework_usage, sophistication_score = self.analyze_dependency_files(commits)
-        language_distribution = self.analyze_language_distribution(commits)
-        full_stack_evidence = self.analyze_full_stack_evidence(commits)
-        complexity_indicators = self.analyze_code_complexity(commits)
-        production_signals = self.analyze_production_readiness(commits)
+        framework_usage, sophistication_score = self.analyze_dependency_files(commits, aggregates)
+        language_distribution = self.analyze_language_distribution(commits, aggregates)
+        full_stack_evidence = self.analyze_full_stack_evidence(commits, aggregates)
+        complexity_indicators = self.analyze_code_complexity(commits, aggregates)
+        production_signals = self.analyze_production_readiness(commits, aggregates)
         
         # Extract AI/ML frameworks from usage
         ai_ml_frameworks = [fw for fw in framework_usage.keys() if fw in self.ai_ml_frameworks]
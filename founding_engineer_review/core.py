@@ -6,8 +6,10 @@ the entire analysis pipeline from data collection to final assessment.
 """
 
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence, Tuple, Union
 
 from .data_sources import GitHubDataSource
 from .analyzers import (
@@ -21,6 +23,20 @@ from .models.metrics import FoundingEngineerMetrics
 from .models.assessment import AssessmentResult
 
 
+# Below this many commits, worker startup and pickling outweigh the analysis
+PARALLEL_MIN_COMMITS = 200
+
+# Data completeness weight per activity type: (present, missing).
+# Issues, PRs, reviews and comments are less critical than commits.
+_PRESENCE_WEIGHTS = {
+    'commits': (1.0, 0.0),
+    'issues': (1.0, 0.5),
+    'pull_requests': (1.0, 0.3),
+    'reviews': (1.0, 0.3),
+    'comments': (1.0, 0.2)
+}
+
+
 class FoundingEngineerReviewer:
     """
     Main class that orchestrates the complete founding engineer review process.
@@ -29,12 +45,20 @@ class FoundingEngineerReviewer:
     generating comprehensive founding engineer assessments.
     """
     
-    def __init__(self, github_token: str):
+    def __init__(self, github_token: Union[str, Sequence[str]], analysis_workers: int = 1,
+                 cache_name: Optional[str] = None, spool_dir: Optional[str] = None):
         """
         Initialize the reviewer with GitHub API access.
         
         Args:
-            github_token: GitHub Personal Access Token
+            github_token: GitHub Personal Access Token, or several tokens to
+                rotate through
+            analysis_workers: Worker processes for the four category analyses
+                (1 runs them sequentially in this process)
+            cache_name: Path of an on-disk HTTP cache for GitHub API responses
+                (requires requests-cache; None disables caching)
+            spool_dir: Directory to stream collected commits to (as JSONL) instead
+                of holding them in memory; None keeps them in memory
             
         Raises:
             ValueError: If github_token is not provided
@@ -43,12 +67,13 @@ class FoundingEngineerReviewer:
             raise ValueError("GitHub token is required")
         
         # Initialize components
-        self.data_source = GitHubDataSource(github_token)
+        self.data_source = GitHubDataSource(github_token, cache_name, spool_dir)
         self.tech_analyzer = TechnicalProficiencyAnalyzer()
         self.craft_analyzer = EngineeringCraftsmanshipAnalyzer()
         self.initiative_analyzer = InitiativeOwnershipAnalyzer()
         self.collab_analyzer = CollaborationStyleAnalyzer()
         self.scorer = FoundingEngineerScorer()
+        self.analysis_workers = analysis_workers
         
         print("✅ Founding Engineer Reviewer initialized")
     
@@ -100,6 +125,40 @@ class FoundingEngineerReviewer:
         """Analyze Category 4: Collaboration Style."""
         return self.collab_analyzer.analyze(activity_data)
     
+    def run_category_analyses(self, activity_data) -> Tuple:
+        """
+        Run all four category analyses.
+        
+        The analyzers share no mutable state, so with analysis_workers > 1 they
+        run concurrently in separate processes (sidestepping the GIL for these
+        CPU-bound text scans), or in threads on a free-threaded interpreter.
+        Histories under PARALLEL_MIN_COMMITS commits always run sequentially.
+        Output lines from the workers may interleave.
+        
+        Args:
+            activity_data: ActivityData object
+            
+        Returns:
+            Tuple of (technical, craftsmanship, initiative, collaboration) metrics
+        """
+        if self.analysis_workers <= 1 or len(activity_data.commits) < PARALLEL_MIN_COMMITS:
+            return (
+                self.analyze_technical_proficiency(activity_data),
+                self.analyze_engineering_craftsmanship(activity_data),
+                self.analyze_initiative_ownership(activity_data),
+                self.analyze_collaboration_style(activity_data)
+            )
+        
+        analyzers = (self.tech_analyzer, self.craft_analyzer, self.initiative_analyzer, self.collab_analyzer)
+        
+        # Free-threaded builds (3.13t) run threads in parallel without pickling
+        gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+        executor_class = ProcessPoolExecutor if gil_enabled else ThreadPoolExecutor
+        
+        with executor_class(max_workers=min(self.analysis_workers, len(analyzers))) as executor:
+            futures = [executor.submit(analyzer.analyze, activity_data) for analyzer in analyzers]
+            return tuple(future.result() for future in futures)
+    
     def generate_comprehensive_review(self, user_identifier: str, months: int = 12, 
                                     include_patches: bool = False) -> AssessmentResult:
         """
@@ -136,10 +195,7 @@ class FoundingEngineerReviewer:
         print("=" * 50)
         
         # Step 2: Run all four category analyses
-        tech_metrics = self.analyze_technical_proficiency(activity_data)
-        craft_metrics = self.analyze_engineering_craftsmanship(activity_data)
-        initiative_metrics = self.analyze_initiative_ownership(activity_data)
-        collab_metrics = self.analyze_collaboration_style(activity_data)
+        tech_metrics, craft_metrics, initiative_metrics, collab_metrics = self.run_category_analyses(activity_data)
         
         # Step 3: Create comprehensive metrics object
         comprehensive_metrics = FoundingEngineerMetrics(
@@ -180,55 +236,33 @@ class FoundingEngineerReviewer:
         Returns:
             Data completeness score (0-1)
         """
-        completeness_factors = []
-        
-        # Check availability of different data types
-        if activity_data.commits:
-            completeness_factors.append(1.0)
-        else:
-            completeness_factors.append(0.0)
-        
-        if activity_data.issues:
-            completeness_factors.append(1.0)
-        else:
-            completeness_factors.append(0.5)  # Issues are less critical
-        
-        if activity_data.pull_requests:
-            completeness_factors.append(1.0)
-        else:
-            completeness_factors.append(0.3)
-        
-        if activity_data.reviews:
-            completeness_factors.append(1.0)
-        else:
-            completeness_factors.append(0.3)
-        
-        if activity_data.comments:
-            completeness_factors.append(1.0)
-        else:
-            completeness_factors.append(0.2)
+        # Weight for each activity type when present / missing
+        data_type_completeness = sum(
+            present if getattr(activity_data, attribute) else missing
+            for attribute, (present, missing) in _PRESENCE_WEIGHTS.items()
+        ) / len(_PRESENCE_WEIGHTS)
         
         # Volume factor - more activities = higher completeness confidence
-        if activity_data.total_activities >= 50:
-            volume_factor = 1.0
-        elif activity_data.total_activities >= 20:
-            volume_factor = 0.8
-        elif activity_data.total_activities >= 10:
-            volume_factor = 0.6
-        else:
-            volume_factor = 0.4
+        total = activity_data.total_activities
+        volume_factor = 1.0 if total >= 50 else 0.8 if total >= 20 else 0.6 if total >= 10 else 0.4
         
         # Calculate weighted completeness
-        data_type_completeness = sum(completeness_factors) / len(completeness_factors)
         overall_completeness = (data_type_completeness * 0.7) + (volume_factor * 0.3)
         
         return overall_completeness
     
     @staticmethod
-    def create_from_env() -> 'FoundingEngineerReviewer':
+    def create_from_env(analysis_workers: int = 1) -> 'FoundingEngineerReviewer':
         """
         Create reviewer instance using GITHUB_TOKEN environment variable.
         
+        GITHUB_TOKEN may hold several comma-separated tokens to rotate through.
+        GITHUB_CACHE, when set, is used as the path of the on-disk HTTP cache,
+        and GITHUB_SPOOL_DIR as the directory collected commits are streamed to.
+        
+        Args:
+            analysis_workers: Worker processes for the four category analyses
+        
         Returns:
             FoundingEngineerReviewer instance
             
@@ -243,4 +277,6 @@ class FoundingEngineerReviewer:
                 "export GITHUB_TOKEN=your_token_here"
             )
         
-        return FoundingEngineerReviewer(github_token)
+        tokens = [token.strip() for token in github_token.split(',') if token.strip()]
+        return FoundingEngineerReviewer(tokens, analysis_workers, os.getenv("GITHUB_CACHE"),
+                                        os.getenv("GITHUB_SPOOL_DIR"))
@@ -2,6 +2,6 @@
 Data sources package initialization.
 """
 
-from .github_source import GitHubDataSource
+from .github_source import GitHubDataSource, GitHubUnavailableError
 
-__all__ = ["GitHubDataSource"]
+__all__ = ["GitHubDataSource", "GitHubUnavailableError"]
@@ -9,10 +9,19 @@ from .metrics import (
     InitiativeOwnershipMetrics,
     CollaborationStyleMetrics,
     ActivityData,
+    CommitRecord,
+    PullRequestRecord,
+    IssueRecord,
+    CommentRecord,
+    ReviewRecord,
+    EventRecord,
+    TimelineEntry,
     WorkRhythmPattern,
     RecommendationLevel
 )
 
+from .record_file import RecordFile
+
 from .assessment import (
     AssessmentResult,
     CategoryAssessment,
@@ -30,8 +39,16 @@ __all__ = [
     "InitiativeOwnershipMetrics",
     "CollaborationStyleMetrics",
     "ActivityData",
+    "CommitRecord",
+    "PullRequestRecord",
+    "IssueRecord",
+    "CommentRecord",
+    "ReviewRecord",
+    "EventRecord",
+    "TimelineEntry",
     "WorkRhythmPattern",
     "RecommendationLevel",
+    "RecordFile",
     
     # Assessment
     "AssessmentResult",
@@ -4,6 +4,7 @@ Assessment models for the Founding Engineer Review System.
 This module contains assessment-specific data structures and results.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -11,6 +12,10 @@ from enum import Enum
 
 from .metrics import RecommendationLevel, FoundingEngineerMetrics
 
+# Strengths and risk factors are created by the dozen per candidate; on
+# Python 3.10+ they drop their per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class RiskLevel(Enum):
     """Enumeration of risk levels."""
@@ -30,7 +35,7 @@ class StrengthCategory(Enum):
     EXECUTION_FOCUS = "Execution Focus"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RiskFactor:
     """Individual risk factor with severity and mitigation suggestions."""
     
@@ -42,7 +47,7 @@ class RiskFactor:
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Strength:
     """Individual strength with supporting evidence."""
     
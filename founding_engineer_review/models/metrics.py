@@ -5,7 +5,7 @@ This module contains all the core data structures used throughout the system.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any
 from datetime import datetime
 from enum import Enum
 
@@ -119,21 +119,168 @@ class FoundingEngineerMetrics:
     data_completeness_score: float = 0.0
 
 
+class CommitRecord(NamedTuple):
+    """A single authored commit.
+    
+    Tuple-backed so that large commit lists carry no per-record __dict__
+    and analyzers read fields by attribute instead of dict lookups.
+    """
+    
+    sha: str
+    message: str
+    author_date: datetime
+    repository: str
+    url: str = ""
+    additions: int = 0
+    deletions: int = 0
+    total_changes: int = 0
+    files_changed: int = 0
+    files: Optional[List[Dict[str, Any]]] = None  # Only present when patches were requested
+
+
+class PullRequestRecord(NamedTuple):
+    """A single pull request authored by the user."""
+    
+    number: int
+    title: str
+    body: str
+    state: str
+    created_at: datetime
+    repository: str
+    id: int = 0
+    updated_at: Optional[datetime] = None
+    closed_at: Optional[datetime] = None
+    merged_at: Optional[datetime] = None
+    url: str = ""
+    additions: int = 0
+    deletions: int = 0
+    changed_files: int = 0
+    commits: int = 0
+    merged: bool = False
+    draft: bool = False
+    labels: Tuple[str, ...] = ()
+    comments_count: int = 0
+
+
+class IssueRecord(NamedTuple):
+    """A single issue opened by the user."""
+    
+    number: int
+    title: str
+    body: str
+    state: str
+    created_at: datetime
+    repository: str
+    id: int = 0
+    updated_at: Optional[datetime] = None
+    closed_at: Optional[datetime] = None
+    url: str = ""
+    labels: Tuple[str, ...] = ()
+    comments_count: int = 0
+
+
+class CommentRecord(NamedTuple):
+    """A single issue or PR review comment, taken from the user's events."""
+    
+    type: str
+    created_at: datetime
+    repository: Optional[str]
+    id: str = ""
+    url: str = ""
+    comment_body: str = ""
+
+
+class ReviewRecord(NamedTuple):
+    """A single code review submitted by the user."""
+    
+    state: str
+    submitted_at: datetime
+    repository: str
+    id: int = 0
+    pr_number: int = 0
+    pr_title: str = ""
+    url: str = ""
+    body: str = ""
+    commit_id: Optional[str] = None
+
+
+class EventRecord(NamedTuple):
+    """A single public event from the user's event feed."""
+    
+    id: str
+    type: str
+    created_at: datetime
+    repo: Optional[str]
+    payload: Dict[str, Any]
+    public: bool = True
+
+
+class TimelineEntry(NamedTuple):
+    """One activity on the combined timeline; data is the underlying record."""
+    
+    type: str
+    timestamp: datetime
+    repository: Optional[str]
+    data: Any
+
+
+# Values the analyzers memoize on commit file entries; not part of the data
+_MEMO_KEYS = frozenset({'_patch_lower'})
+
+
+def _record_to_dict(value: Any) -> Any:
+    """Convert records (and containers of them) to plain dicts and lists.
+    
+    Timestamps are kept as datetimes on the records and only formatted as
+    ISO-8601 strings here, at the export boundary.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, '_asdict'):
+        return {key: _record_to_dict(item) for key, item in value._asdict().items()}
+    if isinstance(value, dict):
+        return {key: _record_to_dict(item) for key, item in value.items() if key not in _MEMO_KEYS}
+    if isinstance(value, (list, tuple)):
+        return [_record_to_dict(item) for item in value]
+    return value
+
+
 @dataclass
 class ActivityData:
     """Raw activity data from GitHub API."""
     
-    commits: List[Dict[str, Any]] = field(default_factory=list)
-    issues: List[Dict[str, Any]] = field(default_factory=list)
-    pull_requests: List[Dict[str, Any]] = field(default_factory=list)
-    comments: List[Dict[str, Any]] = field(default_factory=list)
-    reviews: List[Dict[str, Any]] = field(default_factory=list)
-    events: List[Dict[str, Any]] = field(default_factory=list)
+    commits: List[CommitRecord] = field(default_factory=list)
+    issues: List[IssueRecord] = field(default_factory=list)
+    pull_requests: List[PullRequestRecord] = field(default_factory=list)
+    comments: List[CommentRecord] = field(default_factory=list)
+    reviews: List[ReviewRecord] = field(default_factory=list)
+    events: List[EventRecord] = field(default_factory=list)
     
     # Processed data
-    timeline: List[Dict[str, Any]] = field(default_factory=list)
+    timeline: List[TimelineEntry] = field(default_factory=list)
     repository_involvement: Dict[str, int] = field(default_factory=dict)
     
     # Metadata
     collection_timestamp: datetime = field(default_factory=datetime.now)
     total_activities: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to plain JSON-compatible containers (records become dicts and
+        timestamps ISO-8601 strings).
+        
+        Returns:
+            Dictionary with the same field names as this object
+        """
+        return {
+            'commits': _record_to_dict(list(self.commits)),  # may be a RecordFile
+            'issues': _record_to_dict(self.issues),
+            'pull_requests': _record_to_dict(self.pull_requests),
+            'comments': _record_to_dict(self.comments),
+            'reviews': _record_to_dict(self.reviews),
+            'events': _record_to_dict(self.events),
+            'timeline': _record_to_dict(self.timeline),
+            'repository_involvement': dict(self.repository_involvement),
+            'collection_timestamp': self.collection_timestamp.isoformat(),
+            'total_activities': self.total_activities
+        }
@@ -0,0 +1,94 @@
+"""
+On-disk record storage for the Founding Engineer Review System.
+
+RecordFile keeps records in a JSON Lines file and reads them back lazily, so
+a large collection (commits with patches) never has to be held in memory in
+full. It supports iteration and len() like the lists it stands in for;
+pickling it copies only the path.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Type, get_type_hints
+
+from ..timestamps import parse_timestamp
+from .metrics import _record_to_dict
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+def _encode_line(record: Any) -> bytes:
+    """Encode one record as a JSON line."""
+    data = _record_to_dict(record)
+    if orjson is not None:
+        return orjson.dumps(data) + b'\n'
+    return json.dumps(data).encode('utf-8') + b'\n'
+
+
+def _datetime_fields(record_type: Type) -> Tuple[str, ...]:
+    """Return the fields of a NamedTuple record type that hold timestamps."""
+    return tuple(
+        name for name, hint in get_type_hints(record_type).items()
+        if hint is datetime or hint == Optional[datetime]
+    )
+
+
+class RecordFile:
+    """NamedTuple records stored one per line in a JSONL file."""
+
+    def __init__(self, path: str, record_type: Type, count: int = 0):
+        """
+        Wrap an existing record file.
+
+        Args:
+            path: Path of the JSONL file
+            record_type: NamedTuple class the lines are decoded into
+            count: Number of records in the file
+        """
+        self.path = path
+        self.record_type = record_type
+        self.count = count
+
+    @classmethod
+    def write(cls, path: str, record_type: Type, records: Iterable[Any]) -> 'RecordFile':
+        """
+        Write records to path as they arrive, replacing any existing file.
+
+        Args:
+            path: Path of the JSONL file (parent directories are created)
+            record_type: NamedTuple class of the records
+            records: Records to store; consumed once
+
+        Returns:
+            RecordFile over the written records
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        count = 0
+        with open(path, 'wb') as handle:
+            for record in records:
+                handle.write(_encode_line(record))
+                count += 1
+        return cls(path, record_type, count)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Decode the records one line at a time."""
+        datetime_fields = _datetime_fields(self.record_type)
+        loads = orjson.loads if orjson is not None else json.loads
+
+        with open(self.path, 'rb') as handle:
+            for line in handle:
+                data: Dict[str, Any] = loads(line)
+                for name in datetime_fields:
+                    if data.get(name):
+                        data[name] = parse_timestamp(data[name])
+                yield self.record_type(**data)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"RecordFile({self.path!r}, {self.record_type.__name__}, count={self.count})"
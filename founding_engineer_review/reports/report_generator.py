@@ -6,11 +6,139 @@ in different contexts (executive summary, detailed analysis, JSON export, etc.).
 """
 
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, is_dataclass
 from datetime import datetime
-from typing import Dict, List, Any
+from enum import Enum
+from operator import attrgetter, itemgetter
+from types import SimpleNamespace
+from typing import Dict, List, Any, Optional, TextIO, Tuple
 from pathlib import Path
 
-from ..models.assessment import AssessmentResult, RiskLevel, StrengthCategory
+from ..models.assessment import AssessmentResult, RiskLevel, Strength, StrengthCategory
+from ..models.metrics import RecommendationLevel
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+# Emoji shown next to risks and strengths, by severity and category
+_RISK_EMOJI = {
+    RiskLevel.CRITICAL: '🚨',
+    RiskLevel.HIGH: '⚠️',
+    RiskLevel.MEDIUM: '🔶',
+    RiskLevel.LOW: '💡'
+}
+
+_STRENGTH_EMOJI = {
+    StrengthCategory.TECHNICAL_EXCELLENCE: '🔬',
+    StrengthCategory.LEADERSHIP_POTENTIAL: '👑',
+    StrengthCategory.PRODUCT_MINDSET: '🚀',
+    StrengthCategory.COLLABORATION_SKILLS: '🤝',
+    StrengthCategory.LEARNING_AGILITY: '📚',
+    StrengthCategory.EXECUTION_FOCUS: '⚡'
+}
+
+# Stands in for a category an assessment has no result for; ranks as score 0
+_MISSING_CATEGORY = SimpleNamespace(score=0.0)
+
+# Reports are written line by line; a 1 MB buffer flushes even a large
+# detailed report in a single write call
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Formats save_all_formats writes, in order
+_OUTPUT_FORMATS = ('executive', 'detailed', 'json')
+
+# Values _to_json_data passes through unchanged
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Field names of each dataclass _to_json_data has converted, by class
+_DATACLASS_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+# Recommendation sections of the comparison report, in display order
+_RECOMMENDATION_SECTIONS = (
+    ("### 🌟 Strongly Recommended", RecommendationLevel.STRONGLY_RECOMMENDED),
+    ("### ✅ Recommended", RecommendationLevel.RECOMMENDED),
+    ("### 🔶 Conditional", RecommendationLevel.CONDITIONAL),
+)
+
+
+def _to_json_data(obj: Any) -> Any:
+    """
+    Convert an assessment (or any part of one) to JSON-compatible data.
+    
+    Dataclasses become dicts of all their fields, enums their values and
+    datetimes ISO-8601 strings; lists, tuples and dicts are converted item
+    by item.
+    
+    Args:
+        obj: Value to convert
+        
+    Returns:
+        Plain dicts, lists and scalars
+    """
+    # Exact-type checks first: most values are plain scalars, lists and dicts
+    scalar_types = _JSON_SCALAR_TYPES
+    obj_type = type(obj)
+    if obj_type in scalar_types:
+        return obj
+    if obj_type is list:
+        # Scalar items and fields below are copied without a recursive call
+        return [item if type(item) in scalar_types else _to_json_data(item) for item in obj]
+    if obj_type is dict:
+        return {
+            key: value if type(value) in scalar_types else _to_json_data(value)
+            for key, value in obj.items()
+        }
+    
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    
+    names = _DATACLASS_FIELDS.get(obj_type)
+    if names is None and is_dataclass(obj) and not isinstance(obj, type):
+        names = _DATACLASS_FIELDS[obj_type] = tuple(field.name for field in fields(obj))
+    if names is not None:
+        data = {}
+        for name in names:
+            value = getattr(obj, name)
+            data[name] = value if type(value) in scalar_types else _to_json_data(value)
+        return data
+    
+    if isinstance(obj, (list, tuple)):
+        return [_to_json_data(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _to_json_data(value) for key, value in obj.items()}
+    return obj
+
+
+def _emit(lines: List[str], out: Optional[TextIO]) -> Optional[str]:
+    """
+    Return report lines joined by newlines, or write them to out.
+    
+    Writing line by line leaves the joined report string unbuilt, so a
+    saved report is never held in memory twice.
+    
+    Args:
+        lines: Report lines
+        out: Text file to write to, or None to return the report
+        
+    Returns:
+        The joined report if out is None, otherwise None
+    """
+    if out is None:
+        return "\n".join(lines)
+    
+    if lines:
+        write = out.write
+        write(lines[0])
+        for line in lines[1:]:
+            write("\n" + line)
+    return None
 
 
 class ReportGenerator:
@@ -19,41 +147,40 @@ class ReportGenerator:
     def __init__(self):
         """Initialize report generator."""
         self.templates = self._init_templates()
+        # Output directories already created by save_report, by the name passed in
+        self._output_paths: Dict[str, Path] = {}
     
     def _init_templates(self):
         """Initialize report templates and formatting."""
         return {
-            'risk_emoji': {
-                RiskLevel.CRITICAL: '🚨',
-                RiskLevel.HIGH: '⚠️',
-                RiskLevel.MEDIUM: '🔶',
-                RiskLevel.LOW: '💡'
-            },
-            'strength_emoji': {
-                StrengthCategory.TECHNICAL_EXCELLENCE: '🔬',
-                StrengthCategory.LEADERSHIP_POTENTIAL: '👑',
-                StrengthCategory.PRODUCT_MINDSET: '🚀',
-                StrengthCategory.COLLABORATION_SKILLS: '🤝',
-                StrengthCategory.LEARNING_AGILITY: '📚',
-                StrengthCategory.EXECUTION_FOCUS: '⚡'
-            }
+            'risk_emoji': _RISK_EMOJI,
+            'strength_emoji': _STRENGTH_EMOJI
         }
     
-    def generate_executive_summary(self, assessment: AssessmentResult) -> str:
+    @staticmethod
+    def _fmt_ts(dt: datetime) -> str:
+        """Format a timestamp as 'YYYY-MM-DD HH:MM UTC' without going through strftime."""
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d} UTC"
+    
+    def generate_executive_summary(self, assessment: AssessmentResult,
+                                   out: Optional[TextIO] = None) -> Optional[str]:
         """
         Generate a concise executive summary for leadership.
         
         Args:
             assessment: Complete assessment result
+            out: Text file to write the summary to instead of returning it
             
         Returns:
-            Executive summary as markdown string
+            Executive summary as markdown string, or None if written to out
         """
+        strength_emoji = self.templates['strength_emoji'].get
+        risk_emoji = self.templates['risk_emoji'].get
         lines = []
         
         # Header
         lines.append(f"# Executive Summary: {assessment.candidate_username}")
-        lines.append(f"**Generated:** {assessment.analysis_timestamp.strftime('%Y-%m-%d %H:%M UTC')}")
+        lines.append(f"**Generated:** {self._fmt_ts(assessment.analysis_timestamp)}")
         lines.append(f"**Analysis Period:** {assessment.analysis_period_months} months")
         lines.append("")
         
@@ -75,7 +202,7 @@ class ReportGenerator:
         if assessment.top_strengths:
             lines.append("## ✅ Key Strengths")
             for i, strength in enumerate(assessment.top_strengths[:3], 1):
-                emoji = self.templates['strength_emoji'].get(strength.category, '✅')
+                emoji = strength_emoji(strength.category, '✅')
                 lines.append(f"{i}. {emoji} **{strength.description}**")
                 lines.append(f"   *{strength.impact_potential}*")
             lines.append("")
@@ -84,7 +211,7 @@ class ReportGenerator:
         if assessment.critical_risks:
             lines.append("## ⚠️ Key Risks")
             for i, risk in enumerate(assessment.critical_risks[:3], 1):
-                emoji = self.templates['risk_emoji'].get(risk.severity, '⚠️')
+                emoji = risk_emoji(risk.severity, '⚠️')
                 lines.append(f"{i}. {emoji} **{risk.description}**")
                 lines.append(f"   *{risk.impact_description}*")
             lines.append("")
@@ -99,54 +226,57 @@ class ReportGenerator:
             for step in assessment.next_steps:
                 lines.append(f"- {step}")
         
-        return "\n".join(lines)
+        return _emit(lines, out)
     
-    def generate_detailed_report(self, assessment: AssessmentResult) -> str:
+    def generate_detailed_report(self, assessment: AssessmentResult,
+                                 out: Optional[TextIO] = None) -> Optional[str]:
         """
         Generate a comprehensive detailed report.
         
         Args:
             assessment: Complete assessment result
+            out: Text file to write the report to instead of returning it
             
         Returns:
-            Detailed report as markdown string
+            Detailed report as markdown string, or None if written to out
         """
-        lines = []
-        
-        # Header
-        lines.append(f"# Founding Engineer Assessment: {assessment.candidate_username}")
-        lines.append(f"**Generated:** {assessment.analysis_timestamp.strftime('%Y-%m-%d %H:%M UTC')}")
-        lines.append(f"**Analysis Period:** {assessment.analysis_period_months} months")
-        lines.append(f"**Data Sources:** {', '.join(assessment.data_sources_used)}")
-        lines.append(f"**Analysis Completeness:** {assessment.analysis_completeness:.0%}")
-        lines.append("")
-        
-        # Overall assessment
-        lines.append("## 🎯 Overall Assessment")
-        lines.append("")
-        lines.append("| Metric | Value |")
-        lines.append("|--------|-------|")
-        lines.append(f"| **Overall Score** | {assessment.overall_score:.1f}/100 |")
-        lines.append(f"| **Recommendation** | {assessment.recommendation.value} |")
-        lines.append(f"| **Confidence Level** | {assessment.confidence_level:.0%} |")
-        lines.append("")
-        lines.append(assessment.executive_summary)
-        lines.append("")
+        strength_emoji = self.templates['strength_emoji'].get
+        risk_emoji = self.templates['risk_emoji'].get
+        generated = self._fmt_ts(assessment.analysis_timestamp)
+        recommendation = assessment.recommendation.value
+        
+        # Header and overall assessment: fixed layout, emitted as one block
+        lines = [
+            f"""\
+# Founding Engineer Assessment: {assessment.candidate_username}
+**Generated:** {generated}
+**Analysis Period:** {assessment.analysis_period_months} months
+**Data Sources:** {', '.join(assessment.data_sources_used)}
+**Analysis Completeness:** {assessment.analysis_completeness:.0%}
+
+## 🎯 Overall Assessment
+
+| Metric | Value |
+|--------|-------|
+| **Overall Score** | {assessment.overall_score:.1f}/100 |
+| **Recommendation** | {recommendation} |
+| **Confidence Level** | {assessment.confidence_level:.0%} |
+
+{assessment.executive_summary}
+
+## 📈 Category Analysis
+"""
+        ]
         
         # Category breakdown
-        lines.append("## 📈 Category Analysis")
-        lines.append("")
-        
         for category_name, category_assessment in assessment.category_assessments.items():
-            lines.append(f"### {category_name}")
-            lines.append(f"**Score:** {category_assessment.score:.1f}/100")
-            lines.append("")
+            lines.append(f"### {category_name}\n**Score:** {category_assessment.score:.1f}/100\n")
             
             # Strengths for this category
             if category_assessment.strengths:
                 lines.append("**Strengths:**")
                 for strength in category_assessment.strengths:
-                    emoji = self.templates['strength_emoji'].get(strength.category, '✅')
+                    emoji = strength_emoji(strength.category, '✅')
                     lines.append(f"- {emoji} {strength.description}")
                     if strength.supporting_evidence:
                         lines.append(f"  - Evidence: {', '.join(strength.supporting_evidence[:3])}")
@@ -156,7 +286,7 @@ class ReportGenerator:
             if category_assessment.risk_factors:
                 lines.append("**Risk Factors:**")
                 for risk in category_assessment.risk_factors:
-                    emoji = self.templates['risk_emoji'].get(risk.severity, '⚠️')
+                    emoji = risk_emoji(risk.severity, '⚠️')
                     lines.append(f"- {emoji} {risk.description}")
                     if risk.mitigation_suggestions:
                         lines.append(f"  - Mitigation: {risk.mitigation_suggestions[0]}")
@@ -169,32 +299,20 @@ class ReportGenerator:
                     lines.append(f"- {insight}")
                 lines.append("")
             
-            lines.append("---")
-            lines.append("")
+            lines.append("---\n")
         
         # All strengths
         if assessment.top_strengths:
             lines.append("## ✅ Complete Strengths Analysis")
             lines.append("")
-            for i, strength in enumerate(assessment.top_strengths, 1):
-                emoji = self.templates['strength_emoji'].get(strength.category, '✅')
-                lines.append(f"### {i}. {emoji} {strength.description}")
-                lines.append(f"**Category:** {strength.category.value}")
-                lines.append(f"**Impact:** {strength.impact_potential}")
-                lines.append(f"**Confidence:** {strength.confidence:.0%}")
-                
-                if strength.supporting_evidence:
-                    lines.append("**Evidence:**")
-                    for evidence in strength.supporting_evidence:
-                        lines.append(f"- {evidence}")
-                lines.append("")
+            lines.append(self._format_strength_block(assessment.top_strengths))
         
         # All risks
         if assessment.critical_risks:
             lines.append("## ⚠️ Risk Analysis")
             lines.append("")
             for i, risk in enumerate(assessment.critical_risks, 1):
-                emoji = self.templates['risk_emoji'].get(risk.severity, '⚠️')
+                emoji = risk_emoji(risk.severity, '⚠️')
                 lines.append(f"### {i}. {emoji} {risk.description}")
                 lines.append(f"**Severity:** {risk.severity.value}")
                 lines.append(f"**Impact:** {risk.impact_description}")
@@ -208,144 +326,105 @@ class ReportGenerator:
         
         # Detailed metrics (if available)
         if assessment.detailed_metrics:
-            lines.append("## 📊 Detailed Metrics")
-            lines.append("")
-            
-            # Technical proficiency details
-            tech = assessment.detailed_metrics.technical_proficiency
-            lines.append("### 🔬 Technical Proficiency")
-            lines.append(f"**AI/ML Frameworks:** {', '.join(tech.ai_ml_frameworks) if tech.ai_ml_frameworks else 'None detected'}")
-            lines.append(f"**Performance Languages:** {dict(tech.performance_languages) if tech.performance_languages else 'None'}")
-            lines.append(f"**Dependency Sophistication:** {tech.dependency_sophistication_score:.2f}")
-            lines.append("")
-            
-            # Engineering craftsmanship details
-            craft = assessment.detailed_metrics.engineering_craftsmanship
-            lines.append("### 🛠️ Engineering Craftsmanship")
-            lines.append(f"**Commit-Issue Linking:** {craft.commit_issue_linking_ratio:.1%}")
-            lines.append(f"**Testing Commitment:** {craft.testing_commitment_ratio:.1%}")
-            lines.append(f"**Structured Workflow:** {craft.structured_workflow_score:.2f}")
-            lines.append("")
-            
-            # Initiative & ownership details
-            initiative = assessment.detailed_metrics.initiative_ownership
-            lines.append("### 🚀 Initiative & Ownership")
-            lines.append(f"**Self-Directed Cycles:** {initiative.self_directed_work_cycles}")
-            lines.append(f"**First Responder Instances:** {initiative.first_responder_instances}")
-            lines.append(f"**Personal Project Quality:** {initiative.personal_project_quality:.2f}")
-            lines.append(f"**OSS Contributions:** {initiative.open_source_contributions}")
-            lines.append("")
+            metrics = assessment.detailed_metrics
+            tech = metrics.technical_proficiency
+            craft = metrics.engineering_craftsmanship
+            initiative = metrics.initiative_ownership
+            collab = metrics.collaboration_style
+            frameworks = ', '.join(tech.ai_ml_frameworks) if tech.ai_ml_frameworks else 'None detected'
+            languages = dict(tech.performance_languages) if tech.performance_languages else 'None'
             
-            # Collaboration style details
-            collab = assessment.detailed_metrics.collaboration_style
-            lines.append("### 🤝 Collaboration Style")
-            lines.append(f"**Work Rhythm:** {collab.work_rhythm_pattern.value}")
-            lines.append(f"**Feedback Receptiveness:** {collab.feedback_receptiveness_score:.2f}")
-            lines.append(f"**Temporal Dedication:** {collab.temporal_dedication_score:.2f}")
-            lines.append("")
+            lines.append(f"""\
+## 📊 Detailed Metrics
+
+### 🔬 Technical Proficiency
+**AI/ML Frameworks:** {frameworks}
+**Performance Languages:** {languages}
+**Dependency Sophistication:** {tech.dependency_sophistication_score:.2f}
+
+### 🛠️ Engineering Craftsmanship
+**Commit-Issue Linking:** {craft.commit_issue_linking_ratio:.1%}
+**Testing Commitment:** {craft.testing_commitment_ratio:.1%}
+**Structured Workflow:** {craft.structured_workflow_score:.2f}
+
+### 🚀 Initiative & Ownership
+**Self-Directed Cycles:** {initiative.self_directed_work_cycles}
+**First Responder Instances:** {initiative.first_responder_instances}
+**Personal Project Quality:** {initiative.personal_project_quality:.2f}
+**OSS Contributions:** {initiative.open_source_contributions}
+
+### 🤝 Collaboration Style
+**Work Rhythm:** {collab.work_rhythm_pattern.value}
+**Feedback Receptiveness:** {collab.feedback_receptiveness_score:.2f}
+**Temporal Dedication:** {collab.temporal_dedication_score:.2f}
+""")
         
         # Final recommendation
         lines.append("## 💼 Final Recommendation")
         lines.append("")
-        lines.append(f"**{assessment.recommendation.value}**")
+        lines.append(f"**{recommendation}**")
         lines.append("")
         lines.append(assessment.hiring_recommendation)
         
-        return "\n".join(lines)
+        return _emit(lines, out)
     
-    def generate_json_export(self, assessment: AssessmentResult) -> str:
+    def _format_strength_block(self, strengths: List[Strength]) -> str:
         """
-        Generate JSON export of the complete assessment.
+        Format the numbered strength entries of the detailed report.
         
         Args:
-            assessment: Complete assessment result
+            strengths: Strengths to list, in order
             
         Returns:
-            JSON string of the assessment
+            The entries as one markdown block, each followed by a blank line
         """
-        # Create a safe dictionary representation
-        def safe_serialize(obj):
-            """Safely serialize objects, avoiding recursion."""
-            if obj is None:
-                return None
-            elif isinstance(obj, (str, int, float, bool)):
-                return obj
-            elif isinstance(obj, datetime):
-                return obj.isoformat()
-            elif hasattr(obj, 'value'):  # Enum
-                return obj.value
-            elif isinstance(obj, list):
-                return [safe_serialize(item) for item in obj]
-            elif isinstance(obj, dict):
-                return {k: safe_serialize(v) for k, v in obj.items()}
-            else:
-                # For dataclass objects, manually extract key fields
-                return str(obj)
-        
-        assessment_dict = {
-            'candidate_username': assessment.candidate_username,
-            'overall_score': assessment.overall_score,
-            'recommendation': safe_serialize(assessment.recommendation),
-            'confidence_level': assessment.confidence_level,
-            'executive_summary': assessment.executive_summary,
-            'hiring_recommendation': assessment.hiring_recommendation,
-            'analysis_timestamp': safe_serialize(assessment.analysis_timestamp),
-            'analysis_period_months': assessment.analysis_period_months,
-            'category_scores': safe_serialize(getattr(assessment, 'category_scores', {})),
-            'data_sources_used': assessment.data_sources_used,
-            'analysis_completeness': assessment.analysis_completeness
-        }
-        
-        # Add category assessments if they exist
-        if hasattr(assessment, 'category_assessments') and assessment.category_assessments:
-            assessment_dict['category_assessments'] = {}
-            for name, cat in assessment.category_assessments.items():
-                assessment_dict['category_assessments'][name] = {
-                    'score': cat.score,
-                    'strengths': [
-                        {
-                            'description': s.description,
-                            'confidence': s.confidence,
-                            'category': safe_serialize(getattr(s, 'category', None))
-                        } for s in cat.strengths
-                    ],
-                    'risks': [
-                        {
-                            'description': r.description,
-                            'severity': safe_serialize(getattr(r, 'severity', None)),
-                            'confidence': getattr(r, 'confidence', 0.0)
-                        } for r in cat.risks
-                    ],
-                    'key_findings': cat.key_findings if hasattr(cat, 'key_findings') else []
-                }
-        
-        # Add top strengths if they exist
-        if hasattr(assessment, 'top_strengths') and assessment.top_strengths:
-            assessment_dict['top_strengths'] = [
-                {
-                    'category': safe_serialize(getattr(s, 'category', None)),
-                    'description': s.description,
-                    'supporting_evidence': getattr(s, 'supporting_evidence', []),
-                    'impact_potential': getattr(s, 'impact_potential', ''),
-                    'confidence': s.confidence
-                }
-                for s in assessment.top_strengths
-            ]
+        strength_emoji = self.templates['strength_emoji'].get
+        emojis = [strength_emoji(strength.category, '✅') for strength in strengths]
+        blocks = []
+        for i, (emoji, strength) in enumerate(zip(emojis, strengths), 1):
+            block = (
+                f"### {i}. {emoji} {strength.description}\n"
+                f"**Category:** {strength.category.value}\n"
+                f"**Impact:** {strength.impact_potential}\n"
+                f"**Confidence:** {strength.confidence:.0%}\n"
+            )
+            if strength.supporting_evidence:
+                block += "**Evidence:**\n- " + "\n- ".join(strength.supporting_evidence) + "\n"
+            blocks.append(block)
+        return "\n".join(blocks)
+    
+    def generate_json_export(self, assessment: AssessmentResult, pretty: bool = True,
+                             out: Optional[TextIO] = None) -> Optional[str]:
+        """
+        Generate JSON export of the complete assessment.
         
-        # Add critical risks if they exist
-        if hasattr(assessment, 'critical_risks') and assessment.critical_risks:
-            assessment_dict['critical_risks'] = [
-                {
-                    'category': getattr(r, 'category', 'Unknown'),
-                    'description': r.description,
-                    'severity': safe_serialize(getattr(r, 'severity', None)),
-                    'impact_description': getattr(r, 'impact_description', ''),
-                    'confidence': getattr(r, 'confidence', 0.0)
-                }
-                for r in assessment.critical_risks
-            ]
+        Every field of the assessment is exported under its own name,
+        including the per-category assessments and the detailed metrics.
+        Encoded with orjson when it is installed, which walks the dataclasses,
+        enums and datetimes itself; otherwise converted with _to_json_data.
         
-        return json.dumps(assessment_dict, indent=2, ensure_ascii=False)
+        Args:
+            assessment: Complete assessment result
+            pretty: Indent by two spaces; False gives compact output for
+                machine consumers
+            out: Text file to write the JSON to instead of returning it
+            
+        Returns:
+            JSON string of the assessment, or None if written to out
+        """
+        if orjson is not None:
+            content = orjson.dumps(assessment, option=orjson.OPT_INDENT_2 if pretty else 0).decode('utf-8')
+            if out is None:
+                return content
+            out.write(content)
+            return None
+        
+        assessment_dict = _to_json_data(assessment)
+        options = {'indent': 2} if pretty else {'separators': (',', ':')}
+        if out is None:
+            return json.dumps(assessment_dict, ensure_ascii=False, **options)
+        json.dump(assessment_dict, out, ensure_ascii=False, **options)
+        return None
     
     def save_report(self, assessment: AssessmentResult, output_format: str = 'detailed', 
                    output_dir: str = '.') -> str:
@@ -360,22 +439,27 @@ class ReportGenerator:
         Returns:
             Path to saved file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        now = datetime.now()
+        timestamp = (f"{now.year:04d}{now.month:02d}{now.day:02d}_"
+                     f"{now.hour:02d}{now.minute:02d}{now.second:02d}")
         username = assessment.candidate_username
         
-        output_path = Path(output_dir)
-        output_path.mkdir(exist_ok=True)
+        output_path = self._output_paths.get(output_dir)
+        if output_path is None:
+            output_path = Path(output_dir)
+            output_path.mkdir(exist_ok=True)
+            self._output_paths[output_dir] = output_path
         
         if output_format == 'executive':
-            content = self.generate_executive_summary(assessment)
+            generate = self.generate_executive_summary
             filename = f"founding_engineer_executive_{username}_{timestamp}.md"
             
         elif output_format == 'detailed':
-            content = self.generate_detailed_report(assessment)
+            generate = self.generate_detailed_report
             filename = f"founding_engineer_detailed_{username}_{timestamp}.md"
             
         elif output_format == 'json':
-            content = self.generate_json_export(assessment)
+            generate = self.generate_json_export
             filename = f"founding_engineer_data_{username}_{timestamp}.json"
             
         else:
@@ -383,31 +467,87 @@ class ReportGenerator:
         
         file_path = output_path / filename
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # The generators write straight into the file, so the report text is
+        # never assembled into a single string first
+        with open(file_path, 'w', encoding='utf-8', newline='', buffering=_WRITE_BUFFER_SIZE) as f:
+            generate(assessment, out=f)
         
         print(f"📄 Report saved: {file_path}")
         
         return str(file_path)
     
-    def generate_comparison_report(self, assessments: List[AssessmentResult]) -> str:
+    def save_all_formats(self, assessment: AssessmentResult, output_dir: str = '.',
+                         max_workers: int = 1) -> List[str]:
+        """
+        Save the executive, detailed and JSON reports of an assessment.
+        
+        Args:
+            assessment: Complete assessment result
+            output_dir: Output directory
+            max_workers: Reports to generate and write at once (see save_batch)
+            
+        Returns:
+            Paths to the saved files, in _OUTPUT_FORMATS order
+        """
+        return self._save_each([(assessment, output_format) for output_format in _OUTPUT_FORMATS],
+                               output_dir, max_workers)
+    
+    def save_batch(self, assessments: List[AssessmentResult], output_format: str = 'detailed',
+                   output_dir: str = '.', max_workers: int = 1) -> List[str]:
+        """
+        Save one report per assessment.
+        
+        Report generation holds the GIL, so on a local disk threads only add
+        overhead; raise max_workers when the output directory is on a slow or
+        network filesystem, where overlapping file writes pays off.
+        
+        Args:
+            assessments: Assessment results to save
+            output_format: Format type ('executive', 'detailed', 'json')
+            output_dir: Output directory
+            max_workers: Reports to generate and write at once
+            
+        Returns:
+            Paths to the saved files, in the order of assessments
+        """
+        return self._save_each([(assessment, output_format) for assessment in assessments],
+                               output_dir, max_workers)
+    
+    def _save_each(self, jobs: List[Tuple[AssessmentResult, str]], output_dir: str,
+                   max_workers: int) -> List[str]:
+        """Run save_report for each (assessment, format) job, on threads if max_workers > 1."""
+        if max_workers <= 1 or len(jobs) <= 1:
+            return [self.save_report(assessment, output_format, output_dir) for assessment, output_format in jobs]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            futures = [
+                executor.submit(self.save_report, assessment, output_format, output_dir)
+                for assessment, output_format in jobs
+            ]
+            return [future.result() for future in futures]
+    
+    def generate_comparison_report(self, assessments: List[AssessmentResult],
+                                   out: Optional[TextIO] = None) -> Optional[str]:
         """
         Generate a comparison report for multiple candidates.
         
         Args:
             assessments: List of assessment results to compare
+            out: Text file to write the report to instead of returning it
             
         Returns:
-            Comparison report as markdown string
+            Comparison report as markdown string, or None if written to out
         """
         if not assessments:
-            return "No assessments provided for comparison."
+            return _emit(["No assessments provided for comparison."], out)
         
+        # Enum .value goes through a descriptor; read it once per candidate
+        recommendation_of = {id(a): a.recommendation.value for a in assessments}
         lines = []
         
         # Header
         lines.append("# Founding Engineer Candidate Comparison")
-        lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}")
+        lines.append(f"**Generated:** {self._fmt_ts(datetime.now())}")
         lines.append(f"**Candidates:** {len(assessments)}")
         lines.append("")
         
@@ -417,13 +557,13 @@ class ReportGenerator:
         lines.append("| Candidate | Overall Score | Recommendation | Confidence |")
         lines.append("|-----------|---------------|----------------|------------|")
         
-        for assessment in sorted(assessments, key=lambda a: a.overall_score, reverse=True):
-            lines.append(
-                f"| {assessment.candidate_username} | "
-                f"{assessment.overall_score:.1f}/100 | "
-                f"{assessment.recommendation.value} | "
-                f"{assessment.confidence_level:.0%} |"
-            )
+        lines.extend([
+            f"| {assessment.candidate_username} | "
+            f"{assessment.overall_score:.1f}/100 | "
+            f"{recommendation_of[id(assessment)]} | "
+            f"{assessment.confidence_level:.0%} |"
+            for assessment in sorted(assessments, key=attrgetter('overall_score'), reverse=True)
+        ])
         lines.append("")
         
         # Category comparison
@@ -431,6 +571,7 @@ class ReportGenerator:
         lines.append("")
         
         categories = ["Technical Proficiency", "Engineering Craftsmanship", "Initiative & Ownership", "Collaboration Style"]
+        top_performers = []
         
         for category in categories:
             lines.append(f"### {category}")
@@ -438,7 +579,13 @@ class ReportGenerator:
             lines.append("| Candidate | Score | Key Strength |")
             lines.append("|-----------|-------|--------------|")
             
-            for assessment in sorted(assessments, key=lambda a: a.category_assessments.get(category, type('obj', (object,), {'score': 0})).score, reverse=True):
+            # Score each candidate once; the stable sort keeps input order on
+            # ties, so the first entry is also the category's top performer
+            scored = [(a.category_assessments.get(category, _MISSING_CATEGORY).score, a) for a in assessments]
+            scored.sort(key=itemgetter(0), reverse=True)
+            top_performers.append((category, scored[0]))
+            
+            for _, assessment in scored:
                 cat_assessment = assessment.category_assessments.get(category)
                 if cat_assessment:
                     key_strength = cat_assessment.strengths[0].description if cat_assessment.strengths else "None identified"
@@ -451,11 +598,7 @@ class ReportGenerator:
         lines.append("## 🏆 Top Performers by Category")
         lines.append("")
         
-        for category in categories:
-            top_candidate = max(assessments, 
-                              key=lambda a: a.category_assessments.get(category, type('obj', (object,), {'score': 0})).score)
-            top_score = top_candidate.category_assessments.get(category).score
-            
+        for category, (top_score, top_candidate) in top_performers:
             lines.append(f"**{category}:** {top_candidate.candidate_username} ({top_score:.1f}/100)")
         
         lines.append("")
@@ -464,26 +607,17 @@ class ReportGenerator:
         lines.append("## 💼 Overall Recommendations")
         lines.append("")
         
-        strongly_recommended = [a for a in assessments if a.recommendation.value == "Strongly Recommended"]
-        recommended = [a for a in assessments if a.recommendation.value == "Recommended"]
-        conditional = [a for a in assessments if a.recommendation.value == "Conditional"]
-        
-        if strongly_recommended:
-            lines.append("### 🌟 Strongly Recommended")
-            for assessment in strongly_recommended:
-                lines.append(f"- **{assessment.candidate_username}** ({assessment.overall_score:.1f}/100)")
-            lines.append("")
-        
-        if recommended:
-            lines.append("### ✅ Recommended")
-            for assessment in recommended:
-                lines.append(f"- **{assessment.candidate_username}** ({assessment.overall_score:.1f}/100)")
-            lines.append("")
-        
-        if conditional:
-            lines.append("### 🔶 Conditional")
-            for assessment in conditional:
-                lines.append(f"- **{assessment.candidate_username}** ({assessment.overall_score:.1f}/100)")
-            lines.append("")
+        # One pass buckets the candidates by recommendation, in input order
+        buckets = defaultdict(list)
+        for assessment in assessments:
+            buckets[assessment.recommendation].append(assessment)
+        
+        for heading, level in _RECOMMENDATION_SECTIONS:
+            bucket = buckets.get(level)
+            if bucket:
+                lines.append(heading)
+                for assessment in bucket:
+                    lines.append(f"- **{assessment.candidate_username}** ({assessment.overall_score:.1f}/100)")
+                lines.append("")
         
-        return "\n".join(lines)
+        return _emit(lines, out)
@@ -5,8 +5,8 @@ Implements sophisticated scoring algorithms to evaluate founding engineer potent
 based on the four analysis categories and overall assessment criteria.
 """
 
-from typing import Dict, List, Tuple, Any
-from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple, Any
+from operator import attrgetter
 
 from ..models.metrics import (
     FoundingEngineerMetrics,
@@ -26,6 +26,35 @@ from ..models.assessment import (
     StrengthCategory
 )
 
+# Enum members used on every call; reading one off its Enum class costs
+# about as much as a dict lookup, so they are bound here once
+_CRITICAL = RiskLevel.CRITICAL
+_HIGH = RiskLevel.HIGH
+_STRONGLY_RECOMMENDED = RecommendationLevel.STRONGLY_RECOMMENDED
+_RECOMMENDED = RecommendationLevel.RECOMMENDED
+_CONDITIONAL = RecommendationLevel.CONDITIONAL
+
+# Score bands from best to worst, with the verdict used in the reasoning
+_SCORE_BANDS = (
+    (RecommendationLevel.STRONGLY_RECOMMENDED, "Exceptional founding engineer candidate"),
+    (RecommendationLevel.RECOMMENDED, "Strong founding engineer candidate"),
+    (RecommendationLevel.CONDITIONAL, "Potential candidate with conditions"),
+    (RecommendationLevel.NOT_RECOMMENDED, "Does not meet founding engineer criteria"),
+)
+
+# How the executive summary describes a score, by minimum score; the last
+# entry also covers anything below it
+_SUMMARY_OUTLOOKS = (
+    (80, "demonstrates exceptional"),
+    (65, "shows strong"),
+    (45, "has mixed signals for"),
+    (0, "shows limited"),
+)
+
+# Sort keys for the aggregated strengths and risks
+_by_confidence = attrgetter('confidence')
+_by_severity_and_confidence = attrgetter('severity.value', 'confidence')
+
 
 class FoundingEngineerScorer:
     """Sophisticated scoring system for founding engineer assessment."""
@@ -457,47 +486,35 @@ class FoundingEngineerScorer:
         Returns:
             Tuple of (recommendation_level, reasoning)
         """
+        severities = [rf.severity for rf in risk_factors]
+        
         # Check for critical risks
-        critical_risks = [rf for rf in risk_factors if rf.severity == RiskLevel.CRITICAL]
-        high_risks = [rf for rf in risk_factors if rf.severity == RiskLevel.HIGH]
-        
-        if critical_risks:
-            return RecommendationLevel.NOT_RECOMMENDED, f"Critical risks identified: {len(critical_risks)} issues"
-        
-        # Determine base recommendation from score
-        if overall_score >= self.recommendation_thresholds[RecommendationLevel.STRONGLY_RECOMMENDED]:
-            base_recommendation = RecommendationLevel.STRONGLY_RECOMMENDED
-        elif overall_score >= self.recommendation_thresholds[RecommendationLevel.RECOMMENDED]:
-            base_recommendation = RecommendationLevel.RECOMMENDED
-        elif overall_score >= self.recommendation_thresholds[RecommendationLevel.CONDITIONAL]:
-            base_recommendation = RecommendationLevel.CONDITIONAL
+        critical_count = severities.count(_CRITICAL)
+        if critical_count:
+            return RecommendationLevel.NOT_RECOMMENDED, f"Critical risks identified: {critical_count} issues"
+        
+        # Determine the score band (an index into _SCORE_BANDS)
+        thresholds = self.recommendation_thresholds
+        if overall_score >= thresholds[_STRONGLY_RECOMMENDED]:
+            band = 0
+        elif overall_score >= thresholds[_RECOMMENDED]:
+            band = 1
+        elif overall_score >= thresholds[_CONDITIONAL]:
+            band = 2
         else:
-            base_recommendation = RecommendationLevel.NOT_RECOMMENDED
-        
-        # Adjust for high risks
-        if len(high_risks) >= 3:
-            # Multiple high risks - downgrade recommendation
-            if base_recommendation == RecommendationLevel.STRONGLY_RECOMMENDED:
-                final_recommendation = RecommendationLevel.RECOMMENDED
-                reasoning = f"Strong technical skills but {len(high_risks)} high-risk areas need attention"
-            elif base_recommendation == RecommendationLevel.RECOMMENDED:
-                final_recommendation = RecommendationLevel.CONDITIONAL
-                reasoning = f"Potential candidate but {len(high_risks)} significant concerns"
-            else:
-                final_recommendation = base_recommendation
-                reasoning = f"Score: {overall_score:.1f}, {len(high_risks)} high risks"
-        else:
-            final_recommendation = base_recommendation
-            if final_recommendation == RecommendationLevel.STRONGLY_RECOMMENDED:
-                reasoning = f"Exceptional founding engineer candidate (Score: {overall_score:.1f})"
-            elif final_recommendation == RecommendationLevel.RECOMMENDED:
-                reasoning = f"Strong founding engineer candidate (Score: {overall_score:.1f})"
-            elif final_recommendation == RecommendationLevel.CONDITIONAL:
-                reasoning = f"Potential candidate with conditions (Score: {overall_score:.1f})"
-            else:
-                reasoning = f"Does not meet founding engineer criteria (Score: {overall_score:.1f})"
-        
-        return final_recommendation, reasoning
+            band = 3
+        
+        # Multiple high risks downgrade the top two bands by one level
+        high_count = severities.count(_HIGH)
+        if high_count >= 3:
+            if band == 0:
+                return _RECOMMENDED, f"Strong technical skills but {high_count} high-risk areas need attention"
+            if band == 1:
+                return _CONDITIONAL, f"Potential candidate but {high_count} significant concerns"
+            return _SCORE_BANDS[band][0], f"Score: {overall_score:.1f}, {high_count} high risks"
+        
+        recommendation, verdict = _SCORE_BANDS[band]
+        return recommendation, f"{verdict} (Score: {overall_score:.1f})"
     
     def calculate_confidence_level(self, activity_count: int, data_completeness: float) -> float:
         """
@@ -540,6 +557,57 @@ class FoundingEngineerScorer:
         """
         print("📊 Calculating Founding Engineer Score...")
         
+        result, strength_count, risk_count = self._score_assessment(metrics, activity_count)
+        
+        print(f"✅ Assessment Complete:")
+        print(f"  - Overall Score: {result.overall_score:.1f}/100")
+        print(f"  - Recommendation: {result.recommendation.value}")
+        print(f"  - Confidence: {result.confidence_level:.2f}")
+        print(f"  - Top Strengths: {strength_count}")
+        print(f"  - Risk Factors: {risk_count}")
+        
+        return result
+    
+    def score_batch(self, metrics_list: List[FoundingEngineerMetrics],
+                    activity_counts: Optional[List[int]] = None) -> List[AssessmentResult]:
+        """
+        Score many candidates, e.g. every member of an organization.
+        
+        Gives the same results as calling score_comprehensive_assessment on
+        each candidate, but prints one line for the whole batch instead of a
+        progress report per candidate.
+        
+        Args:
+            metrics_list: Complete metrics of each candidate
+            activity_counts: Total activity count of each candidate, in the same
+                order; None treats every count as 0
+            
+        Returns:
+            AssessmentResult of each candidate, in order
+            
+        Raises:
+            ValueError: If activity_counts and metrics_list differ in length
+        """
+        if activity_counts is None:
+            activity_counts = [0] * len(metrics_list)
+        elif len(activity_counts) != len(metrics_list):
+            raise ValueError(
+                f"Got {len(activity_counts)} activity counts for {len(metrics_list)} candidates"
+            )
+        
+        score = self._score_assessment
+        results = [score(metrics, activity_count)[0] for metrics, activity_count in zip(metrics_list, activity_counts)]
+        
+        print(f"✅ Scored {len(results)} candidates")
+        return results
+    
+    def _score_assessment(self, metrics: FoundingEngineerMetrics, activity_count: int) -> Tuple[AssessmentResult, int, int]:
+        """
+        Score one candidate without printing progress.
+        
+        Returns:
+            Tuple of (assessment, number of strengths, number of risk factors)
+        """
         # Score each category
         tech_score, tech_strengths, tech_risks = self.score_technical_proficiency(metrics.technical_proficiency)
         craft_score, craft_strengths, craft_risks = self.score_engineering_craftsmanship(metrics.engineering_craftsmanship)
@@ -561,8 +629,8 @@ class FoundingEngineerScorer:
         all_risks = tech_risks + craft_risks + initiative_risks + collab_risks
         
         # Sort strengths and risks by confidence/severity
-        all_strengths.sort(key=lambda s: s.confidence, reverse=True)
-        all_risks.sort(key=lambda r: (r.severity.value, r.confidence), reverse=True)
+        all_strengths.sort(key=_by_confidence, reverse=True)
+        all_risks.sort(key=_by_severity_and_confidence, reverse=True)
         
         # Determine recommendation
         recommendation, reasoning = self.determine_recommendation(overall_score, all_risks)
@@ -624,30 +692,17 @@ class FoundingEngineerScorer:
             hiring_recommendation=reasoning
         )
         
-        print(f"✅ Assessment Complete:")
-        print(f"  - Overall Score: {overall_score:.1f}/100")
-        print(f"  - Recommendation: {recommendation.value}")
-        print(f"  - Confidence: {confidence:.2f}")
-        print(f"  - Top Strengths: {len(all_strengths)}")
-        print(f"  - Risk Factors: {len(all_risks)}")
-        
-        return result
+        return result, len(all_strengths), len(all_risks)
     
     def _generate_executive_summary(self, score: float, recommendation: RecommendationLevel, 
                                   top_strengths: List[Strength], top_risks: List[RiskFactor]) -> str:
         """Generate executive summary of the assessment."""
         
-        summary_parts = []
-        
         # Overall assessment
-        if score >= 80:
-            summary_parts.append(f"This candidate demonstrates exceptional founding engineer potential with a score of {score:.1f}/100.")
-        elif score >= 65:
-            summary_parts.append(f"This candidate shows strong founding engineer potential with a score of {score:.1f}/100.")
-        elif score >= 45:
-            summary_parts.append(f"This candidate has mixed signals for founding engineer potential with a score of {score:.1f}/100.")
-        else:
-            summary_parts.append(f"This candidate shows limited founding engineer potential with a score of {score:.1f}/100.")
+        for minimum_score, outlook in _SUMMARY_OUTLOOKS:
+            if score >= minimum_score:
+                break
+        summary_parts = [f"This candidate {outlook} founding engineer potential with a score of {score:.1f}/100."]
         
         # Key strengths
         if top_strengths:
@@ -0,0 +1,55 @@
+"""
+Timestamp helpers for the Founding Engineer Review System.
+
+GitHub returns ISO-8601 strings; parse_timestamp parses them with ciso8601 when
+it is installed and falls back to datetime.fromisoformat otherwise. Records from
+the data source already hold datetimes, so analyzers go through as_datetime,
+which only parses values that are still ISO-8601 strings.
+"""
+
+from datetime import datetime
+from typing import Union
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime  # type: ignore
+except ImportError:
+    _parse_datetime = None
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp, accepting GitHub's trailing 'Z'.
+
+    Args:
+        value: ISO-8601 timestamp string
+
+    Returns:
+        Parsed datetime
+
+    Raises:
+        ValueError: If the string is not a valid timestamp
+    """
+    if _parse_datetime is not None:
+        return _parse_datetime(value)
+
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+def as_datetime(value: Union[str, datetime]) -> datetime:
+    """
+    Return a record timestamp as a datetime, parsing it only if it is a string.
+    
+    Args:
+        value: datetime, or ISO-8601 timestamp string
+        
+    Returns:
+        The datetime value
+        
+    Raises:
+        ValueError: If a string value is not a valid timestamp
+    """
+    if isinstance(value, datetime):
+        return value
+    return parse_timestamp(value)
@@ -16,11 +16,22 @@ import json
 import argparse
 from datetime import datetime, timedelta, timezone
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from github import Github
 from github.GithubException import GithubException
 
 
+REST_API_URL = 'https://api.github.com'
+GRAPHQL_URL = 'https://api.github.com/graphql'
+
+# Concurrent commit detail requests; kept small to stay clear of GitHub's
+# secondary rate limits
+COMMIT_DETAIL_WORKERS = 10
+
+
 class GitHubActivityTracker:
     def __init__(self, github_token):
         """Initialize the tracker with GitHub token."""
@@ -33,6 +44,21 @@ class GitHubActivityTracker:
             'Authorization': f'token {github_token}',
             'Accept': 'application/vnd.github.v3+json'
         }
+        
+        # One keep-alive session for direct API calls, so repeated GraphQL
+        # requests reuse the TLS connection instead of handshaking each time.
+        # GraphQL queries are read-only, so POST is safe to retry.
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+                      allowed_methods=frozenset({'GET', 'POST'}))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update(self.headers)
+    
+    def close(self):
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
     
     def resolve_user_login(self, user_identifier):
         """
@@ -83,8 +109,8 @@ class GitHubActivityTracker:
             }
             """
             
-            response = requests.post(
-                'https://api.github.com/graphql',
+            response = self.session.post(
+                GRAPHQL_URL,
                 headers={'Authorization': f'Bearer {self.token}'},
                 json={'query': query, 'variables': {'email': user_identifier}},
                 timeout=10
@@ -453,77 +479,30 @@ class GitHubActivityTracker:
             search_query = f"author:{username}"
             commit_results = self.g.search_commits(search_query, sort="author-date", order="desc")
             
+            # Read everything needed from the search results here, so the worker
+            # threads below never touch the shared PyGithub client
+            recent_commits = []
             for commit in commit_results:
                 if commit.commit.author and commit.commit.author.date:
                     if commit.commit.author.date >= cutoff_date:
-                        # Get detailed file changes
-                        file_changes = []
-                        total_additions = 0
-                        total_deletions = 0
-                        
-                        try:
-                            # Fetch detailed commit data with file changes
-                            detailed_commit = self.g.get_repo(commit.repository.full_name).get_commit(commit.sha)
-                            
-                            if hasattr(detailed_commit, 'files') and detailed_commit.files:
-                                for file in detailed_commit.files:
-                                    # Determine file type and whether to include content
-                                    file_type, should_include_content = self._analyze_file_type(file.filename)
-                                    
-                                    # Skip binary, cache, and other non-essential files
-                                    if not should_include_content:
-                                        continue
-                                    
-                                    file_change = {
-                                        'filename': file.filename,
-                                        'file_type': file_type,
-                                        'status': file.status,  # 'added', 'modified', 'removed', 'renamed'
-                                        'additions': file.additions,
-                                        'deletions': file.deletions,
-                                        'changes': file.changes
-                                    }
-                                    
-                                    # Include patch/diff only if requested and file is text-based
-                                    if include_patches and file.patch and file_type != 'binary':
-                                        # Clean and truncate patch content
-                                        patch_content = file.patch
-                                        if len(patch_content) > 2000:
-                                            patch_content = patch_content[:2000] + "\n... [truncated for brevity]"
-                                        file_change['patch'] = patch_content
-                                        
-                                        # Extract key changes for summary
-                                        file_change['change_summary'] = self._extract_change_summary(file.patch, file_type)
-                                    
-                                    # Add previous filename for renames
-                                    if hasattr(file, 'previous_filename') and file.previous_filename:
-                                        file_change['previous_filename'] = file.previous_filename
-                                    
-                                    file_changes.append(file_change)
-                                    total_additions += file.additions
-                                    total_deletions += file.deletions
-                            
-                        except Exception as e:
-                            print(f"⚠️  Could not fetch file details for commit {commit.sha[:8]}: {e}")
-                            # Fallback to basic stats if available
-                            if hasattr(commit, 'stats') and commit.stats:
-                                total_additions = commit.stats.additions
-                                total_deletions = commit.stats.deletions
-                        
-                        commits.append({
+                        recent_commits.append({
                             'type': 'commit',
                             'timestamp': commit.commit.author.date.isoformat(),
                             'repository': commit.repository.full_name,
                             'sha': commit.sha,
                             'message': commit.commit.message,
-                            'url': commit.html_url,
-                            'additions': total_additions,
-                            'deletions': total_deletions,
-                            'files_changed': len(file_changes),
-                            'file_changes': file_changes
+                            'url': commit.html_url
                         })
                     else:
                         break  # Commits are sorted by date
             
+            # File details are not in the search response and need one request
+            # per commit; issue those requests concurrently, keeping the order
+            with ThreadPoolExecutor(max_workers=COMMIT_DETAIL_WORKERS) as executor:
+                commits = list(executor.map(
+                    lambda commit: self._add_commit_details(commit, include_patches), recent_commits
+                ))
+            
             print(f"✅ Found {len(commits)} commits")
             return commits
             
@@ -531,6 +510,105 @@ class GitHubActivityTracker:
             print(f"❌ Error fetching commits: {e}")
             return []
     
+    def _fetch_commit_json(self, repository, sha):
+        """
+        Fetch a commit with its stats and every page of its file list.
+        
+        Goes through self.session rather than PyGithub: a Github client shares
+        one connection between threads, so concurrent requests through it can
+        be handed each other's responses.
+        
+        Args:
+            repository (str): Repository full name (owner/name)
+            sha (str): Commit SHA
+            
+        Returns:
+            dict: Commit data from the REST API, with 'files' from all pages
+        """
+        response = self.session.get(f"{REST_API_URL}/repos/{repository}/commits/{sha}", timeout=30)
+        response.raise_for_status()
+        data = response.json()
+        
+        # The file list is paginated (300 files per page)
+        while 'next' in response.links:
+            response = self.session.get(response.links['next']['url'], timeout=30)
+            response.raise_for_status()
+            data['files'].extend(response.json().get('files', []))
+        
+        return data
+    
+    def _add_commit_details(self, commit, include_patches):
+        """
+        Add file details to a commit activity. Safe to call from worker threads.
+        
+        Args:
+            commit (dict): Commit activity built from the search result
+            include_patches (bool): Whether to include code patches/diffs
+            
+        Returns:
+            dict: The same commit activity, with additions, deletions and file changes
+        """
+        # Get detailed file changes
+        file_changes = []
+        total_additions = 0
+        total_deletions = 0
+        detailed_commit = {}
+        
+        try:
+            # Fetch detailed commit data with file changes
+            detailed_commit = self._fetch_commit_json(commit['repository'], commit['sha'])
+            
+            for file in detailed_commit.get('files') or []:
+                # Determine file type and whether to include content
+                file_type, should_include_content = self._analyze_file_type(file['filename'])
+                
+                # Skip binary, cache, and other non-essential files
+                if not should_include_content:
+                    continue
+                
+                file_change = {
+                    'filename': file['filename'],
+                    'file_type': file_type,
+                    'status': file['status'],  # 'added', 'modified', 'removed', 'renamed'
+                    'additions': file['additions'],
+                    'deletions': file['deletions'],
+                    'changes': file['changes']
+                }
+                
+                # Include patch/diff only if requested and file is text-based
+                patch = file.get('patch')
+                if include_patches and patch and file_type != 'binary':
+                    # Clean and truncate patch content
+                    patch_content = patch
+                    if len(patch_content) > 2000:
+                        patch_content = patch_content[:2000] + "\n... [truncated for brevity]"
+                    file_change['patch'] = patch_content
+                    
+                    # Extract key changes for summary
+                    file_change['change_summary'] = self._extract_change_summary(patch, file_type)
+                
+                # Add previous filename for renames
+                if file.get('previous_filename'):
+                    file_change['previous_filename'] = file['previous_filename']
+                
+                file_changes.append(file_change)
+                total_additions += file['additions']
+                total_deletions += file['deletions']
+            
+        except Exception as e:
+            print(f"⚠️  Could not fetch file details for commit {commit['sha'][:8]}: {e}")
+            # Fallback to basic stats if available
+            stats = detailed_commit.get('stats')
+            if stats:
+                total_additions = stats['additions']
+                total_deletions = stats['deletions']
+        
+        commit['additions'] = total_additions
+        commit['deletions'] = total_deletions
+        commit['files_changed'] = len(file_changes)
+        commit['file_changes'] = file_changes
+        return commit
+    
     def get_issues_activity(self, username, days=365):
         """
         Fetch issues created by the user.
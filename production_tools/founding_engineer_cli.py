@@ -64,6 +64,13 @@ Examples:
         help='Output directory for reports (default: current directory)'
     )
     
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='Worker processes for the four category analyses (default: 1, sequential)'
+    )
+    
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -83,7 +90,7 @@ Examples:
     
     try:
         # Initialize reviewer
-        reviewer = FoundingEngineerReviewer.create_from_env()
+        reviewer = FoundingEngineerReviewer.create_from_env(args.workers)
         
         # Generate comprehensive review
         assessment = reviewer.generate_comprehensive_review(